@@ -1,4 +1,3 @@
-import os
 import re
 from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
@@ -24,6 +23,16 @@ def get_version():
 
 __version__ = get_version()
 
-from .main import main
+
+def __getattr__(name):
+    # The CLI (click, inquirer, requests, the scanners) is only imported when
+    # ``main`` is first used, so reading ``__version__`` stays cheap.
+    if name == "main":
+        from .main import main
+
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["main", "__version__"]
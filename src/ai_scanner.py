@@ -8,6 +8,8 @@ parsing lives in :mod:`src.ai_parser`.
 import os
 import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -15,7 +17,7 @@ from loguru import logger
 
 from .ai_parser import parse_llm_response
 from .providers import call_bedrock, call_ollama, call_openai, list_ollama_models
-from .regex_scanner import RegexScanner
+from .regex_scanner import RegexScanner, _iter_files, _read_source_file
 from .token_utils import count_tokens, tokenizer_source
 from .utils import (
     get_bedrock_access_key_id,
@@ -37,6 +39,7 @@ class AIScanner:
     """Scanner that uses LLMs to identify privacy data elements in source code."""
 
     DEFAULT_AI_MODE = "balanced"
+    DEFAULT_AI_CONCURRENCY = 1
     DEFAULT_OPENAI_MODEL = "gpt-4o"
     DEFAULT_OLLAMA_MODEL = "llama3"
     DEFAULT_BEDROCK_MODEL = "anthropic.claude-3-haiku-20240307-v1:0"
@@ -92,11 +95,14 @@ class AIScanner:
         self,
         data_elements_dir: Optional[str] = None,
         ai_mode: Optional[str] = None,
+        concurrency: Optional[int] = None,
     ) -> None:
         if data_elements_dir is None:
             data_elements_dir = Path(__file__).parent.parent / "data_elements"
         self.data_elements_dir = Path(data_elements_dir)
         self.data_elements_names = self._load_data_elements_names()
+        self._prompt_prefix = ""
+        self._prompt_prefix_key = None
         self.selected_model = "Unknown"
         self.last_scan_usage = {
             "files_scanned": 0,
@@ -133,6 +139,15 @@ class AIScanner:
             except ValueError:
                 pass
 
+        # Number of files sent to the provider at once; 1 keeps scanning serial.
+        if concurrency is None:
+            try:
+                concurrency = int(os.environ.get("TRUSCANNER_AI_CONCURRENCY", self.DEFAULT_AI_CONCURRENCY))
+            except ValueError:
+                concurrency = self.DEFAULT_AI_CONCURRENCY
+        self.concurrency: int = max(int(concurrency), 1)
+        self._usage_lock = threading.Lock()
+
     # -----------------------------------------------------------------------
     # Data element loading
     # -----------------------------------------------------------------------
@@ -234,23 +249,23 @@ class AIScanner:
             "[END FILE TAIL]"
         )
 
-    def _get_prompt(self, file_content: str, filename: str) -> str:
-        """Build the LLM prompt for a single file.
+    def _get_prompt_prefix(self) -> str:
+        """Return the part of the prompt that is the same for every file.
 
-        Only the base file name is embedded in the prompt (not the full path)
-        to avoid leaking filesystem structure and to prevent path injection.
+        It is built once per set of element names. Keeping it ahead of the
+        file-specific text lets providers reuse their cache of the common
+        prefix (OpenAI prompt caching, the Ollama context cache) across files.
         """
-        elements_list = ", ".join(
-            name.strip()
-            for name in self.data_elements_names
-            if isinstance(name, str) and name.strip()
-        ) or "All configured privacy data elements"
+        key = tuple(self.data_elements_names)
+        if self._prompt_prefix_key != key:
+            elements_list = ", ".join(
+                name.strip()
+                for name in self.data_elements_names
+                if isinstance(name, str) and name.strip()
+            ) or "All configured privacy data elements"
 
-        # Use only the file name to avoid embedding user-controlled path components.
-        safe_filename = Path(filename).name
-
-        return f"""
-Analyze the code from '{safe_filename}' and find privacy-sensitive data handling (PII and related identifiers).
+            self._prompt_prefix = f"""
+Analyze the code below and find privacy-sensitive data handling (PII and related identifiers).
 
 Use these data element types as guidance: {elements_list}
 
@@ -264,6 +279,21 @@ Rules:
 - Keep "matched_text" short and specific.
 - Ignore comments, docs, and generic keyword/enumeration lists that do not represent real data handling.
 - Prefer runtime data collection/storage/transmission paths over configuration constants.
+"""
+            self._prompt_prefix_key = key
+        return self._prompt_prefix
+
+    def _get_prompt(self, file_content: str, filename: str) -> str:
+        """Build the LLM prompt for a single file.
+
+        Only the base file name is embedded in the prompt (not the full path)
+        to avoid leaking filesystem structure and to prevent path injection.
+        """
+        # Use only the file name to avoid embedding user-controlled path components.
+        safe_filename = Path(filename).name
+
+        return f"""{self._get_prompt_prefix()}
+File: '{safe_filename}'
 
 Code Content:
 {file_content}
@@ -314,8 +344,7 @@ Code Content:
         has no signal, or the provider call fails.
         """
         try:
-            with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+            content = _read_source_file(filepath)
 
             if not content.strip():
                 return []
@@ -331,10 +360,11 @@ Code Content:
             raw_text = self._call_provider(selected_provider, prompt, filepath, model)
             prompt_tokens = count_tokens(prompt, model=self.selected_model if self.selected_model != "Unknown" else None)
             response_tokens = count_tokens(raw_text, model=self.selected_model if self.selected_model != "Unknown" else None)
-            self.last_scan_usage["files_scanned"] += 1
-            self.last_scan_usage["input_tokens"] += prompt_tokens
-            self.last_scan_usage["output_tokens"] += response_tokens
-            self.last_scan_usage["total_tokens"] += prompt_tokens + response_tokens
+            with self._usage_lock:
+                self.last_scan_usage["files_scanned"] += 1
+                self.last_scan_usage["input_tokens"] += prompt_tokens
+                self.last_scan_usage["output_tokens"] += response_tokens
+                self.last_scan_usage["total_tokens"] += prompt_tokens + response_tokens
             return parse_llm_response(
                 raw_text, filepath, self.selected_model, file_lines=file_lines
             )
@@ -351,12 +381,13 @@ Code Content:
         model: Optional[str],
     ) -> str:
         """Dispatch to the correct provider and return raw LLM response text."""
-        if provider == "openai" and get_openai_api_key():
+        api_key = get_openai_api_key() if provider == "openai" else None
+        if api_key:
             self.selected_model = self.DEFAULT_OPENAI_MODEL
             return call_openai(
                 prompt,
                 filepath,
-                api_key=get_openai_api_key(),  # type: ignore[arg-type]
+                api_key=api_key,
                 model=self.selected_model,
             )
 
@@ -399,11 +430,13 @@ Code Content:
         use_openai: bool = False,
         model: Optional[str] = None,
         extensions: Optional[List[str]] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> List[Dict[str, Any]]:
         """Scan all eligible files in *directory* using AI.
 
         File filtering (extensions, excluded dirs/files) mirrors the regex
-        scanner defaults for consistency.
+        scanner defaults for consistency. Once ``cancel_event`` is set, files
+        not yet sent to the provider are skipped.
         """
         self.last_scan_usage = {
             "files_scanned": 0,
@@ -428,20 +461,15 @@ Code Content:
         if path.is_file():
             files_to_scan = [str(path)]
         else:
-            # followlinks=False (default) prevents symlink loop traversal.
-            for root, dirs, files in os.walk(path, followlinks=False):
-                dirs[:] = [d for d in dirs if d not in exclude_dirs and not d.startswith(".")]
-                for file in files:
-                    if file.startswith(".") or file in exclude_files:
-                        continue
-                    file_ext = Path(file).suffix.lower()
-                    if file_ext in exclude_exts or file_ext not in allowed_extensions:
-                        continue
-                    files_to_scan.append(os.path.join(root, file))
+            files_to_scan = list(_iter_files(
+                path, exclude_dirs, exclude_files, exclude_exts, allowed_extensions
+            ))
 
-        for file_path in files_to_scan:
+        def _scan_one(file_path: str) -> List[Dict[str, Any]]:
+            if cancel_event is not None and cancel_event.is_set():
+                return []
             try:
-                file_findings = self.scan_file(
+                return self.scan_file(
                     file_path,
                     provider=provider,
                     use_openai=use_openai,
@@ -452,8 +480,18 @@ Code Content:
                 # scan_file with the legacy two-argument signature.
                 if "provider" not in str(exc):
                     raise
-                file_findings = self.scan_file(file_path, use_openai=use_openai, model=model)
-            all_findings.extend(file_findings)
+                return self.scan_file(file_path, use_openai=use_openai, model=model)
+
+        # Provider calls are network-bound, so several files can be in flight
+        # at once; map() keeps findings in file order either way.
+        workers = min(self.concurrency, len(files_to_scan))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for file_findings in executor.map(_scan_one, files_to_scan):
+                    all_findings.extend(file_findings)
+        else:
+            for file_path in files_to_scan:
+                all_findings.extend(_scan_one(file_path))
 
         return all_findings
 
@@ -3,18 +3,20 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from . import __version__
 from .ai_scanner import AIScanner
-from .regex_scanner import RegexScanner
+from .regex_scanner import REPORT_WRITE_BUFFER, RegexScanner
 from .report_utils import (
     create_reports_subdirectory,
     generate_report_id,
-    get_next_report_filename,
+    get_next_report_filenames,
     get_reports_directory,
 )
 from .scanner import run_ai_scan, run_regex_scan
 from .utils import (
+    PERSONAL_CATEGORIES,
     get_ai_provider_setup_help,
     get_bedrock_model_id,
     get_missing_provider_requirements,
@@ -24,29 +26,37 @@ from .utils import (
     load_runtime_env,
     select_ollama_model,
     show_progress,
+    encode_upload_payload,
+    filter_personal_findings,
+    is_personal_category,
     upload_to_backend,
 )
 
 load_runtime_env()
 
 
-PERSONAL_CATEGORIES = [
-    'Personal Identifiable Information',
-    'PII',
-    'Contact Information',
-    'Government-Issued Identifiers',
-    'Authentication & Credentials',
-    'Health & Biometric Data',
-    'Sensitive Personal Data',
-]
+# Minimum seconds between progress bar redraws (~30 Hz).
+PROGRESS_REFRESH_INTERVAL = 0.033
 
+def _finalize_results(findings, personal_only, files_with_findings=None):
+    """Apply --personal-only and count files with findings in one pass.
 
-def _filter_personal_findings(findings):
-    return [
-        finding
-        for finding in findings
-        if any(cat in finding.get('element_category', '') for cat in PERSONAL_CATEGORIES)
-    ]
+    When nothing is filtered and the scanner already counted the files
+    (``files_with_findings``), the findings are returned without a walk.
+    """
+    if not personal_only and files_with_findings is not None:
+        return findings, files_with_findings
+
+    kept = []
+    filenames = set()
+    for finding in findings:
+        if personal_only and not is_personal_category(finding.get('element_category', '')):
+            continue
+        filename = finding.get('filename')
+        if filename:
+            filenames.add(filename)
+        kept.append(finding)
+    return kept, len(filenames)
 
 
 def _file_types_to_generate(file_type: str):
@@ -55,8 +65,10 @@ def _file_types_to_generate(file_type: str):
 
 def _show_runtime_info():
     """Print runtime details so local/global install mismatches are obvious."""
-    click.echo(f"Python executable: {sys.executable}")
-    click.echo(f"CLI module path: {os.path.realpath(__file__)}")
+    click.echo(
+        f"Python executable: {sys.executable}\n"
+        f"CLI module path: {os.path.realpath(__file__)}"
+    )
 
 
 def _save_reports(
@@ -70,68 +82,76 @@ def _save_reports(
     base_name,
     token_usage=None,
 ):
-    saved_files = []
-
-    for file_type in file_types:
-        filename = get_next_report_filename(reports_subdir, file_type, base_name=base_name)
-        filepath = reports_subdir / filename
-
-        if file_type == 'txt':
-            report = scanner.generate_report(
-                findings,
-                duration=duration,
-                report_id=report_id,
-                directory_scanned=directory,
-                token_usage=token_usage,
-            )
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(report)
-        elif file_type == 'md':
-            report = scanner.generate_markdown_report(
-                findings,
-                duration=duration,
-                report_id=report_id,
-                directory_scanned=directory,
-                token_usage=token_usage,
-            )
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(report)
-        elif file_type == 'json':
-            report = scanner.generate_json_report(
-                findings,
-                duration=duration,
-                report_id=report_id,
-                directory_scanned=directory,
-                token_usage=token_usage,
-            )
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
-
-        saved_files.append(str(filepath))
-
-    return saved_files
-
-
-def _echo_saved_files(title, filepaths):
-    click.echo(f"\n{title}")
-    for filepath in filepaths:
-        click.echo(f"  ✅ {filepath}")
+    # Aggregate once and share the result across every requested format.
+    summarize = getattr(scanner, "summarize_findings", None)
+    report_kwargs = {
+        "duration": duration,
+        "report_id": report_id,
+        "directory_scanned": directory,
+        "token_usage": token_usage,
+    }
+    if summarize is not None:
+        report_kwargs["summary"] = summarize(findings)
+
+    generators = {
+        'txt': scanner.generate_report,
+        'md': scanner.generate_markdown_report,
+        'json': scanner.generate_json_report,
+    }
+
+    filenames = get_next_report_filenames(reports_subdir, file_types, base_name=base_name)
+    filepaths = [reports_subdir / filenames[file_type] for file_type in file_types]
+
+    def _render_and_write(file_type, filepath):
+        if file_type == 'json':
+            report = json.dumps(generators[file_type](findings, **report_kwargs), indent=2, ensure_ascii=False)
+            # Same platform line endings as a text-mode write.
+            filepath.write_bytes(report.replace('\n', os.linesep).encode('utf-8'))
+            return
+        # Text reports stream straight into the file.
+        with open(filepath, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as fh:
+            generators[file_type](findings, writer=fh, **report_kwargs)
+
+    # Each format renders and writes independently, so one format's disk
+    # write overlaps with the next one's rendering.
+    if len(file_types) > 1:
+        with ThreadPoolExecutor(max_workers=len(file_types)) as executor:
+            list(executor.map(_render_and_write, file_types, filepaths))
+    else:
+        for file_type, filepath in zip(file_types, filepaths):
+            _render_and_write(file_type, filepath)
+
+    return [str(filepath) for filepath in filepaths]
+
+
+def _saved_files_lines(title, filepaths):
+    return [f"\n{title}"] + [f"  ✅ {filepath}" for filepath in filepaths]
+
+
+def _token_usage_lines(title, token_usage):
+    return [
+        title,
+        f"  Tokenizer: {token_usage.get('tokenizer', 'unknown')}",
+        f"  Files Scanned: {token_usage.get('files_scanned', 0)}",
+        f"  Input Tokens: {token_usage.get('input_tokens', 0)}",
+        f"  Output Tokens: {token_usage.get('output_tokens', 0)}",
+        f"  Total Tokens: {token_usage.get('total_tokens', 0)}",
+    ]
 
 
 def _show_scan_summary(report_id, findings, duration, saved_files, token_usage=None):
-    click.echo(f"\n{'='*80}")
-    click.echo(f"Scan Report ID: {report_id}")
-    click.echo(f"{'='*80}")
-    click.echo(f"\nTotal Findings: {len(findings)}")
-    click.echo(f"Time Taken: {duration:.2f} seconds")
+    # Build the whole summary first and emit it with a single echo.
+    lines = [
+        f"\n{'='*80}",
+        f"Scan Report ID: {report_id}",
+        f"{'='*80}",
+        f"\nTotal Findings: {len(findings)}",
+        f"Time Taken: {duration:.2f} seconds",
+    ]
     if token_usage:
-        click.echo("Token Usage:")
-        click.echo(f"  Tokenizer: {token_usage.get('tokenizer', 'unknown')}")
-        click.echo(f"  Files Scanned: {token_usage.get('files_scanned', 0)}")
-        click.echo(f"  Input Tokens: {token_usage.get('input_tokens', 0)}")
-        click.echo(f"  Output Tokens: {token_usage.get('output_tokens', 0)}")
-        click.echo(f"  Total Tokens: {token_usage.get('total_tokens', 0)}")
-    _echo_saved_files("Reports saved to:", saved_files)
+        lines.extend(_token_usage_lines("Token Usage:", token_usage))
+    lines.extend(_saved_files_lines("Reports saved to:", saved_files))
+    click.echo("\n".join(lines))
 
 
 def _prepare_ai_scan(provider: str, ai_mode: str):
@@ -192,10 +212,16 @@ def main():
     show_default=True,
     help='AI scan mode: fast (speed), balanced (default), full (max coverage)',
 )
+@click.option(
+    '--ai-concurrency',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of files the AI scan sends to the provider at once (default: 1)',
+)
 @click.option('--format', type=click.Choice(['json', 'report']), default='report', help='Output format (deprecated, use interactive prompt)')
 @click.option('--output', '-o', type=click.Path(), help='Save report to file (deprecated, reports saved to reports/)')
 @click.option('--personal-only', is_flag=True, help='Only report personal identifiable information (PII) data elements')
-def scan(directory, with_ai, ai_provider, ai_mode, format, output, personal_only):
+def scan(directory, with_ai, ai_provider, ai_mode, ai_concurrency, format, output, personal_only):
     """Scan a directory for privacy-related data elements."""
     file_type = select_file_format()
     ai_mode = (ai_mode or "balanced").lower()
@@ -204,34 +230,57 @@ def scan(directory, with_ai, ai_provider, ai_mode, format, output, personal_only
     click.echo(f"\nScanning: {directory}...")
 
     report_id = generate_report_id(directory)
-    scanner = None
-    configured_elements = 0
-    try:
-        scanner = RegexScanner()
-        configured_elements = len(getattr(scanner, "data_elements", []) or [])
-    except Exception:
-        scanner = None
-        configured_elements = 0
-
-    if scanner is None:
-        scanner = RegexScanner()
+    scanner = RegexScanner()
+    configured_elements = len(getattr(scanner, "data_elements", []) or [])
 
     if configured_elements:
         click.echo(f"Loaded data element definitions: {configured_elements}")
 
+    last_progress_draw = [0.0]
+
     def progress_callback(current, total, file_path):
+        # Redraw at most PROGRESS_REFRESH_INTERVAL apart; always draw the final update.
+        now = time.monotonic()
+        if current != total and now - last_progress_draw[0] < PROGRESS_REFRESH_INTERVAL:
+            return
+        last_progress_draw[0] = now
         show_progress(current, total, file_path)
 
-    regex_start_time = time.time()
+    regex_start_time = time.monotonic()
     regex_results = run_regex_scan(
         directory,
         progress_callback=progress_callback,
         regex_scanner=scanner,
+        processes=os.cpu_count(),
     )
-    regex_duration = time.time() - regex_start_time
+    regex_duration = time.monotonic() - regex_start_time
 
-    if personal_only:
-        regex_results = _filter_personal_findings(regex_results)
+    scan_stats = getattr(scanner, "last_scan_stats", None) or {}
+    regex_results, unique_files = _finalize_results(
+        regex_results,
+        personal_only,
+        files_with_findings=scan_stats.get("files_with_findings"),
+    )
+
+    # Serialize the upload payload in the background while reports are written
+    # and the user is prompted; nothing is sent until they consent below.
+    project_name = os.path.basename(os.path.normpath(directory)) or "Untitled Project"
+    metadata = {
+        "cli_version": __version__,
+        "directory_scanned": directory,
+    }
+    upload_fields = dict(
+        scan_report_id=report_id,
+        project_name=project_name,
+        duration=regex_duration,
+        total_findings=len(regex_results),
+        scan_data=regex_results,
+        files_scanned=unique_files,
+        metadata=metadata,
+    )
+    upload_executor = ThreadPoolExecutor(max_workers=1)
+    encoded_upload = upload_executor.submit(encode_upload_payload, **upload_fields)
+    upload_executor.shutdown(wait=False)
 
     reports_dir = get_reports_directory()
     reports_subdir = create_reports_subdirectory(reports_dir, directory)
@@ -264,17 +313,18 @@ def scan(directory, with_ai, ai_provider, ai_mode, format, output, personal_only
     if selected_provider:
         should_run_ai, selected_model = _prepare_ai_scan(selected_provider, ai_mode)
         if should_run_ai:
-            ai_start_time = time.time()
+            ai_start_time = time.monotonic()
             ai_results = run_ai_scan(
                 directory,
                 ai_provider=selected_provider,
                 ai_mode=ai_mode,
                 model=selected_model,
+                concurrency=ai_concurrency,
             )
-            ai_duration = time.time() - ai_start_time
+            ai_duration = time.monotonic() - ai_start_time
 
             if personal_only:
-                ai_results = _filter_personal_findings(ai_results)
+                ai_results = filter_personal_findings(ai_results)
 
             if ai_results:
                 ai_saved_files = _save_reports(
@@ -288,16 +338,12 @@ def scan(directory, with_ai, ai_provider, ai_mode, format, output, personal_only
                     base_name="truscan_report_llm",
                     token_usage=getattr(run_ai_scan, "last_usage", None),
                 )
-                click.echo(f"\nEnhanced findings: {len(ai_results)}")
-                _echo_saved_files("Enhanced reports saved to:", ai_saved_files)
+                lines = [f"\nEnhanced findings: {len(ai_results)}"]
+                lines.extend(_saved_files_lines("Enhanced reports saved to:", ai_saved_files))
                 ai_token_usage = getattr(run_ai_scan, "last_usage", None)
                 if ai_token_usage:
-                    click.echo("Enhanced Token Usage:")
-                    click.echo(f"  Tokenizer: {ai_token_usage.get('tokenizer', 'unknown')}")
-                    click.echo(f"  Files Scanned: {ai_token_usage.get('files_scanned', 0)}")
-                    click.echo(f"  Input Tokens: {ai_token_usage.get('input_tokens', 0)}")
-                    click.echo(f"  Output Tokens: {ai_token_usage.get('output_tokens', 0)}")
-                    click.echo(f"  Total Tokens: {ai_token_usage.get('total_tokens', 0)}")
+                    lines.extend(_token_usage_lines("Enhanced Token Usage:", ai_token_usage))
+                click.echo("\n".join(lines))
             else:
                 click.echo("\nNo additional data elements found by AI.")
 
@@ -309,28 +355,18 @@ def scan(directory, with_ai, ai_provider, ai_mode, format, output, personal_only
     )
 
     if analyze.upper() == 'Y' or analyze == '':
-        project_name = os.path.basename(os.path.normpath(directory)) or "Untitled Project"
-        unique_files = len(set(r.get('filename') for r in regex_results if r.get('filename')))
-
-        metadata = {
-            "cli_version": __version__,
-            "directory_scanned": directory,
-        }
-
         success = upload_to_backend(
-            scan_report_id=report_id,
-            project_name=project_name,
-            duration=regex_duration,
-            total_findings=len(regex_results),
-            scan_data=regex_results,
-            files_scanned=unique_files,
-            metadata=metadata,
+            **upload_fields,
+            encoded_payload=encoded_upload,
         )
 
         if success:
             click.echo("✅ Scan results uploaded to backend successfully!")
             click.echo(f"Scan Report ID: {report_id}")
             click.echo(f"View scan report online: https://app.truconsent.io/scan/{report_id}")
+    else:
+        # Nothing is sent; skip the encoding if the worker has not started it.
+        encoded_upload.cancel()
 
 
 if __name__ == "__main__":
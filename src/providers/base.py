@@ -1,9 +1,29 @@
 """Shared utilities used by all AI provider implementations."""
 
+import itertools
 import sys
 import threading
 import time
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Tuple
+
+# Serializes spinner writes when several files are scanned concurrently.
+_OUTPUT_LOCK = threading.Lock()
+
+# Provider calls in flight, by call id: (filepath, start time).
+_ACTIVE_CALLS: Dict[int, Tuple[str, float]] = {}
+_CALL_IDS = itertools.count()
+
+
+def _progress_line() -> str:
+    """Return the spinner text for the calls in flight (caller holds the lock)."""
+    now = time.monotonic()
+    if len(_ACTIVE_CALLS) == 1:
+        filepath, start_time = next(iter(_ACTIVE_CALLS.values()))
+        return f"AI Scanning: {filepath}... ({now - start_time:.1f}s taken)"
+    # Several files at once share one aggregate line instead of taking
+    # turns overwriting it.
+    longest = now - min(start for _, start in _ACTIVE_CALLS.values())
+    return f"AI Scanning: {len(_ACTIVE_CALLS)} files at once... (longest {longest:.1f}s taken)"
 
 
 def run_with_progress(filepath: str, fn: Callable[[], Any]) -> Any:
@@ -11,6 +31,8 @@ def run_with_progress(filepath: str, fn: Callable[[], Any]) -> Any:
 
     Returns the value returned by *fn*, or re-raises any exception it raised.
     Using a daemon thread means the spinner will not prevent interpreter exit.
+    While several calls run concurrently, the spinner shows one line for all
+    of them.
     """
     result: Dict[str, Any] = {"value": None, "error": None}
 
@@ -21,18 +43,26 @@ def run_with_progress(filepath: str, fn: Callable[[], Any]) -> Any:
             result["error"] = exc
 
     thread = threading.Thread(target=_worker, daemon=True)
+    start_time = time.monotonic()
+    call_id = next(_CALL_IDS)
+    with _OUTPUT_LOCK:
+        _ACTIVE_CALLS[call_id] = (filepath, start_time)
     thread.start()
 
-    start_time = time.time()
-    while thread.is_alive():
-        elapsed = time.time() - start_time
-        sys.stdout.write(f"\rAI Scanning: {filepath}... ({elapsed:.1f}s taken)")
-        sys.stdout.flush()
-        time.sleep(0.1)
+    try:
+        while thread.is_alive():
+            with _OUTPUT_LOCK:
+                sys.stdout.write(f"\r\033[K{_progress_line()}")
+                sys.stdout.flush()
+            time.sleep(0.1)
+    finally:
+        with _OUTPUT_LOCK:
+            del _ACTIVE_CALLS[call_id]
 
-    elapsed = time.time() - start_time
-    sys.stdout.write(f"\r\033[K✓ AI Scanned: {filepath} ({elapsed:.1f}s taken)\n")
-    sys.stdout.flush()
+    elapsed = time.monotonic() - start_time
+    with _OUTPUT_LOCK:
+        sys.stdout.write(f"\r\033[K✓ AI Scanned: {filepath} ({elapsed:.1f}s taken)\n")
+        sys.stdout.flush()
 
     if result["error"] is not None:
         raise result["error"]
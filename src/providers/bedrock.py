@@ -1,17 +1,21 @@
 """AWS Bedrock provider for AI-based privacy scanning."""
 
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-try:
-    import boto3
-    _HAS_BOTO3 = True
-except ImportError:
-    boto3 = None  # type: ignore[assignment]
-    _HAS_BOTO3 = False
-
 from .base import run_with_progress
 
 
+@lru_cache(maxsize=None)
+def _load_boto3():
+    """Import boto3 on first use; returns None when it is not installed."""
+    try:
+        import boto3
+    except ImportError:
+        return None
+    return boto3
+
+
 def call_bedrock(
     prompt: str,
     filepath: str,
@@ -49,7 +53,8 @@ def call_bedrock(
         Raw text from the model response, or an empty string on failure.
     """
     def _call() -> Any:
-        if not _HAS_BOTO3:
+        boto3 = _load_boto3()
+        if boto3 is None:
             raise ImportError("boto3 is required for AWS Bedrock. Install it with: pip install boto3")
 
         session_kwargs: Dict[str, Any] = {"region_name": region}
@@ -1,13 +1,20 @@
 """Ollama provider for AI-based privacy scanning."""
 
+from functools import lru_cache
 from typing import Any, List
 
-import ollama as _ollama
 from loguru import logger
 
 from .base import extract_message_content, run_with_progress
 
 
+@lru_cache(maxsize=None)
+def _ollama():
+    """Import the ollama client on first use; it is slow to import."""
+    import ollama
+    return ollama
+
+
 def call_ollama(
     prompt: str,
     filepath: str,
@@ -39,10 +46,10 @@ def call_ollama(
             },
         }
         try:
-            return _ollama.chat(format="json", **payload)
+            return _ollama().chat(format="json", **payload)
         except TypeError:
             # Older ollama clients may not accept `format` as a keyword arg.
-            return _ollama.chat(**payload)
+            return _ollama().chat(**payload)
 
     response = run_with_progress(filepath, _call)
     if not response:
@@ -56,7 +63,7 @@ def list_models() -> List[str]:
     Returns an empty list if Ollama is not running or has no models installed.
     """
     try:
-        models_info = _ollama.list()
+        models_info = _ollama().list()
         if hasattr(models_info, "models"):
             return [m.model for m in models_info.models]
         if isinstance(models_info, list):
@@ -2,8 +2,6 @@
 
 from typing import Any
 
-from openai import OpenAI
-
 from .base import run_with_progress
 
 
@@ -26,6 +24,9 @@ def call_openai(
         Raw text from the model response, or an empty string on failure.
     """
     def _call() -> Any:
+        # Imported here: the openai SDK is slow to import and only needed for this provider.
+        from openai import OpenAI
+
         client = OpenAI(api_key=api_key)
         return client.chat.completions.create(
             model=model,
@@ -1,18 +1,466 @@
+import io
 import os
 import re
 import json
 import sys
+import functools
 import time
 import threading
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
+import operator
+import multiprocessing
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator, TextIO
 import bisect
 
 from loguru import logger
 
+try:
+    import re2
+    _HAS_RE2 = hasattr(re2, "Set")
+except ImportError:
+    re2 = None  # type: ignore[assignment]
+    _HAS_RE2 = False
+
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
+    _HAS_AHOCORASICK = False
+
+# Buffer size for report files, so large reports go out in few writes.
+REPORT_WRITE_BUFFER = 1 << 20
+
+# Characters where RE2 and Python's ``re`` disagree on ``\s`` for str input.
+_RE2_UNSAFE_CHARS = re.compile(r'[\x0b\x1c-\x1f]')
+# Syntax that is valid in both engines but means something different.
+_RE2_UNPORTABLE_SYNTAX = ('$', '\\Z', '{,', '[:')
+
+
+_LOOKAROUND_OPENERS = ('(?=', '(?!', '(?<=', '(?<!')
+
+
+def _skip_class(source: str, i: int) -> int:
+    """Return the index just past the character class opening at ``source[i]``."""
+    i += 1
+    if source.startswith('^', i):
+        i += 1
+    if source.startswith(']', i):
+        i += 1
+    while i < len(source) and source[i] != ']':
+        i += 2 if source[i] == '\\' else 1
+    return i + 1
+
+
+def _strip_lookarounds(source: str) -> Optional[str]:
+    """Drop lookahead/lookbehind assertions from a regex source.
+
+    Removing an assertion can only widen what a pattern matches, so the result
+    is a safe screen for the original. Returns None if ``source`` is unbalanced.
+    """
+    out = []
+    i, n = 0, len(source)
+    while i < n:
+        c = source[i]
+        if c == '\\':
+            out.append(source[i:i + 2])
+            i += 2
+        elif c == '[':
+            end = _skip_class(source, i)
+            out.append(source[i:end])
+            i = end
+        elif c == '(' and source.startswith(_LOOKAROUND_OPENERS, i):
+            depth = 0
+            while i < n:
+                c = source[i]
+                if c == '\\':
+                    i += 2
+                    continue
+                if c == '[':
+                    i = _skip_class(source, i)
+                    continue
+                if c == '(':
+                    depth += 1
+                elif c == ')':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                i += 1
+            if depth:
+                return None
+            i += 1
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out)
+
+
+# Stand-in for every non-ASCII character when screening non-ASCII text.
+_PLACEHOLDER = '\x01'
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+_CASE_INSENSITIVE_GROUP = re.compile(r'\(\?[a-zA-Z-]*i[a-zA-Z-]*[:)]')
+# Escapes that may match a non-ASCII character under ``re``, and their
+# RE2 equivalent extended with the placeholder.
+_WIDE_ESCAPES = {'w': '[\\w\\x01]', 'd': '[\\d\\x01]', 's': '[\\s\\x01]'}
+
+
+def _widen_for_placeholder(source: str, ignorecase: bool) -> Optional[str]:
+    """Rewrite a lookaround-free pattern so it also accepts the placeholder.
+
+    Wherever the ``re`` pattern could match a non-ASCII character, the result
+    accepts ``_PLACEHOLDER`` instead, and word boundaries (whose meaning
+    depends on the replaced characters) are dropped. Screening placeholder
+    text with it is therefore sound. Returns None for syntax this does not
+    handle.
+    """
+    if not source.isascii():
+        return None
+    out = []
+    i, n = 0, len(source)
+    while i < n:
+        c = source[i]
+        if c == '\\':
+            e = source[i + 1:i + 2]
+            if e in _WIDE_ESCAPES:
+                out.append(_WIDE_ESCAPES[e])
+            elif e in ('W', 'D', 'S', 'A'):
+                out.append(source[i:i + 2])
+            elif e in ('b', 'B'):
+                pass
+            elif e and not e.isalnum():
+                out.append(source[i:i + 2])
+            else:
+                return None
+            i += 2
+        elif c == '[':
+            end = _skip_class(source, i)
+            body = source[i + 1:end - 1]
+            negated = body.startswith('^')
+            escapes = set(re.findall(r'\\(.)', body))
+            if escapes - set('wdsWDS') - {ch for ch in escapes if not ch.isalnum()}:
+                return None
+            if negated:
+                # [^\W] and friends exclude the placeholder but not every
+                # non-ASCII character.
+                if escapes & set('WDS'):
+                    return None
+                out.append(source[i:end])
+            elif escapes or (ignorecase and any(ch.isalpha() for ch in body)):
+                out.append(source[i:end - 1] + '\\x01]')
+            else:
+                out.append(source[i:end])
+            i = end
+        elif c == '(' and source.startswith('(?', i):
+            m = re.match(r'\(\?(?::|[a-zA-Z-]+[:)]|P<\w+>)', source[i:])
+            if m is None:
+                return None
+            out.append(m.group(0))
+            i += m.end()
+        elif ignorecase and c.isalpha():
+            out.append(f'[{c}\\x01]')
+            i += 1
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out)
+
+
+class _RE2Prefilter:
+    """Screen text with a single RE2 set before running the ``re`` patterns.
+
+    Every portable pattern is added to one ``re2.Set``, so a single linear-time
+    pass over a file tells which patterns can match at all. Matching itself
+    still happens with the compiled ``re`` patterns, which keeps findings
+    identical. Patterns with lookarounds, which RE2 lacks, are screened with
+    the assertions removed; anything RE2 still rejects always runs.
+
+    Non-ASCII text is screened by a second set: every non-ASCII character is
+    replaced by ``_PLACEHOLDER`` and matched against patterns widened by
+    ``_widen_for_placeholder``, since RE2 and ``re`` disagree on Unicode
+    classes, word boundaries and case folding.
+    """
+
+    def __init__(self, data_elements: List[Dict[str, Any]]):
+        options = re2.Options()
+        options.max_mem = 64 << 20
+        options.log_errors = False
+        self._set = re2.Set.SearchSet(options)
+        self._screened = []
+        self._unscreened = set()
+        self._wide_set = re2.Set.SearchSet(options)
+        self._wide_screened = []
+        self._wide_unscreened = set()
+
+        for element in data_elements:
+            for pattern in element["patterns"]:
+                source = pattern.pattern
+                if isinstance(source, str) and not any(tok in source for tok in _RE2_UNPORTABLE_SYNTAX):
+                    relaxed = _strip_lookarounds(source)
+                    if self._add(self._set, source) or self._add(self._set, relaxed):
+                        self._screened.append(pattern)
+                        ignorecase = bool(pattern.flags & re.IGNORECASE) or bool(
+                            _CASE_INSENSITIVE_GROUP.search(source)
+                        )
+                        wide = _widen_for_placeholder(relaxed, ignorecase) if relaxed else None
+                        if self._add(self._wide_set, wide):
+                            self._wide_screened.append(pattern)
+                        else:
+                            self._wide_unscreened.add(pattern)
+                        continue
+                self._unscreened.add(pattern)
+                self._wide_unscreened.add(pattern)
+
+        self._set.Compile()
+        self._wide_set.Compile()
+
+    @staticmethod
+    def _add(target, source: Optional[str]) -> bool:
+        if source is None:
+            return False
+        try:
+            target.Add(source)
+            return True
+        except re2.error:
+            return False
+
+    def candidates(self, text: str) -> Optional[set]:
+        """Return the patterns that may match ``text``, or None if it can't be screened."""
+        if text.isascii():
+            if _RE2_UNSAFE_CHARS.search(text):
+                return None
+            matched = self._set.Match(text) or ()
+            return self._unscreened.union(self._screened[i] for i in matched)
+
+        if _PLACEHOLDER in text:
+            return None
+        screened_text = _NON_ASCII.sub(_PLACEHOLDER, text)
+        if _RE2_UNSAFE_CHARS.search(screened_text):
+            return None
+        matched = self._wide_set.Match(screened_text) or ()
+        return self._wide_unscreened.union(self._wide_screened[i] for i in matched)
+
+
+class _KeywordIndex:
+    """Find which element keywords occur in a (lowercased) text.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed and falls
+    back to one substring check per distinct keyword otherwise.
+    """
+
+    def __init__(self, keywords):
+        self._keywords = tuple(sorted(keywords))
+        self._automaton = None
+        if _HAS_AHOCORASICK and self._keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def hits(self, text_lower: str) -> set:
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text_lower)}
+        return {keyword for keyword in self._keywords if keyword in text_lower}
+
+
+class _PatternTables:
+    """Lookup tables derived from the loaded data elements.
+
+    ``shared_patterns`` holds patterns used by more than one element, whose
+    matches are computed once per text and reused. ``keyword_index`` finds all
+    keywords present in a text at once and ``keyword_elements`` maps each
+    keyword to the indices of the elements it gates; ``ungated`` lists the
+    elements without keywords, which always run. ``prefilter`` is the RE2
+    prefilter, or None when disabled.
+    """
+
+    def __init__(self, data_elements: List[Dict[str, Any]], use_re2: bool):
+        usage = defaultdict(int)
+        for element in data_elements:
+            for pattern in set(element["patterns"]):
+                usage[pattern] += 1
+        self.shared_patterns = frozenset(p for p, count in usage.items() if count > 1)
+
+        keyword_elements = defaultdict(list)
+        ungated = []
+        for index, element in enumerate(data_elements):
+            keywords = element.get("keywords")
+            if not keywords:
+                ungated.append(index)
+            for keyword in set(keywords or ()):
+                keyword_elements[keyword].append(index)
+        self.keyword_elements = {kw: tuple(indices) for kw, indices in keyword_elements.items()}
+        self.ungated = tuple(ungated)
+        self.keyword_index = _KeywordIndex(self.keyword_elements)
+        # With every element gated by keywords, a text without any keyword
+        # cannot produce findings.
+        self.all_gated = bool(data_elements) and not ungated
+
+        self.prefilter = None
+        if use_re2 and data_elements:
+            try:
+                self.prefilter = _RE2Prefilter(data_elements)
+            except Exception as e:
+                logger.debug("RE2 prefilter unavailable, using re only: {}", e)
+
+
+class _Tee:
+    """Writer that passes every write on to several streams."""
+
+    def __init__(self, *streams: TextIO):
+        self._streams = streams
+
+    def write(self, text: str) -> None:
+        for stream in self._streams:
+            stream.write(text)
+
+
+def _line_starts(text: str) -> List[int]:
+    """Return the offset at which each line of ``text`` starts."""
+    starts = [0]
+    starts.extend(itertools.accumulate(len(line) + 1 for line in text.split('\n')[:-1]))
+    return starts
+
+
+def _same_elements(first: Optional[tuple], second: tuple) -> bool:
+    """Return True when both tuples hold the very same element objects."""
+    return (
+        first is not None
+        and len(first) == len(second)
+        and all(map(operator.is_, first, second))
+    )
+
+
+# Leading bytes checked for NUL bytes to tell binary files from text.
+_BINARY_SNIFF_SIZE = 8192
+
+
+def _read_source_file(filepath: str) -> str:
+    """Read ``filepath`` as UTF-8 text, or return "" if it looks binary.
+
+    A NUL byte in the first few KiB marks a binary file, which is skipped
+    before decoding it. Text is decoded exactly like ``open(filepath, 'r',
+    encoding='utf-8', errors='ignore')``, universal newlines included.
+    """
+    with open(filepath, 'rb') as f:
+        if b'\x00' in f.read(_BINARY_SNIFF_SIZE):
+            return ""
+        f.seek(0)
+        return io.TextIOWrapper(f, encoding='utf-8', errors='ignore').read()
+
+
+def _write_lines(writer: TextIO, lines) -> None:
+    """Write ``lines`` joined by newlines, like ``"\n".join`` but streamed."""
+    first = True
+    for line in lines:
+        if not first:
+            writer.write("\n")
+        writer.write(line)
+        first = False
+
+
+def _iter_files(root: str, exclude_dirs, exclude_files, exclude_exts, include_exts):
+    """Yield paths of the files to scan under ``root``, in ``os.walk`` order.
+
+    Hidden entries and excluded directories are pruned. Symlinked directories
+    are not followed, which avoids loops. ``DirEntry`` reuses the type
+    information from the directory listing, so no extra ``stat`` calls are
+    needed.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if name not in exclude_dirs and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                if name in exclude_files:
+                    continue
+                ext = os.path.splitext(name)[1].lower()
+                if ext in include_exts and ext not in exclude_exts:
+                    yield entry.path
+        stack.extend(reversed(subdirs))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile ``pattern`` once per process, so elements sharing a regex share one object."""
+    return re.compile(pattern, flags)
+
+
+# ASCII characters that Unicode ``\s`` matches but ``re.ASCII`` ``\s`` does not.
+_ASCII_MODE_UNSAFE_CHARS = re.compile(r'[\x1c-\x1f]')
+
+
+@functools.lru_cache(maxsize=None)
+def _ascii_variant(pattern: re.Pattern) -> re.Pattern:
+    """Return ``pattern`` recompiled with ``re.ASCII``, or ``pattern`` if it cannot be.
+
+    On ASCII text without ``_ASCII_MODE_UNSAFE_CHARS`` both find the same
+    matches, and the ASCII one skips re's Unicode character and case
+    folding lookups, which roughly halves matching time.
+    """
+    source = pattern.pattern
+    if not isinstance(source, str) or not source.isascii():
+        return pattern
+    try:
+        return _compile(source, (pattern.flags & ~re.UNICODE) | re.ASCII)
+    except (re.error, ValueError):
+        return pattern
+
+
+# False-positive checks that do not depend on the matched text. The literal
+# lists are short, so one alternation beats a substring test per literal.
+_FP_MARKUP = re.compile(
+    r'device-width|device-height|apple-touch-icon|viewport|meta name|content=|rel='
+    r'|font-family|google fonts'
+)
+_FP_DEVICE_CONTEXT = re.compile(r'width|height|touch-icon|font|meta')
+_FP_QUOTED_FIELD = re.compile(r'["\']\s*(email|phone|name|address)\s*(field|column|attribute|property)')
+_FP_SQL_STATEMENT = re.compile(r'\b(SELECT|INSERT\s+INTO|UPDATE\s+\w+\s+SET)\s+', re.IGNORECASE)
+_FP_EMAIL_VALUE = re.compile(r'email\s*[:=]\s*["\']?[^"\']*@', re.IGNORECASE)
+_FP_PHONE_DIGITS = re.compile(r'\d{6,}')
+_FP_PHONE_VALUE = re.compile(r'(phone|mobile)\s*[:=]\s*["\']?[^"\']*\d{6,}', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fp_matched_text_pattern(matched_text: str) -> re.Pattern:
+    """Return one pattern for the false-positive checks built around ``matched_text``.
+
+    Each check only decides whether the match is skipped, so a single
+    alternation answers all of them with one search.
+    """
+    escaped = re.escape(matched_text)
+    return re.compile('|'.join((
+        # function parameters that are just variable names
+        r'\bfunction\s+\w+\s*\([^)]*\b' + escaped + r'\b',
+        # object property definitions without actual values
+        r'\b' + escaped + r'\s*[:=]\s*["\']?\s*[,}]',
+        # return statements with just variable names
+        r'\breturn\s+' + escaped + r'\s*[;,]',
+        # variable declarations without values
+        r'\b(?:const|let|var)\s+' + escaped + r'\s*[;,]',
+        # assignments without a value
+        r'\b' + escaped + r'\s*=\s*["\']?\s*[;,\n]',
+    )), re.IGNORECASE)
+
 
 class RegexScanner:
     """Scanner that uses regex patterns from JSON files to identify privacy data elements."""
@@ -69,6 +517,23 @@ class RegexScanner:
         '.sqlite3', '.bin', '.exe', '.dll', '.so', '.dylib',
     }
 
+    # Forked worker processes only pay off on large scans. On a 4-core Linux
+    # box a 40-file project took 0.07s on threads but 0.18s in a forked pool:
+    # roughly 0.16s to start the pool against under 2ms of matching per file,
+    # so the pool wins from a couple of hundred files. Each worker gets at
+    # least PROCESS_POOL_FILES_PER_WORKER files to amortise its start-up.
+    PROCESS_POOL_MIN_FILES = 256
+    PROCESS_POOL_FILES_PER_WORKER = 64
+
+    # Compiled element definitions shared by every scanner instance, keyed by
+    # data elements directory and validated against each file's mtime and size.
+    _ELEMENTS_CACHE: Dict[Any, Any] = {}
+    _ELEMENTS_CACHE_LOCK = threading.Lock()
+
+    # Lookup tables last built for each RE2 setting, with the element dicts
+    # they were built from, so new scanners over the cached elements reuse them.
+    _TABLES_CACHE: Dict[bool, Any] = {}
+
     def __init__(self, data_elements_dir: Optional[str] = None, load_immediately: bool = True):
         """Initialize scanner with data element patterns."""
         if data_elements_dir is None:
@@ -77,14 +542,45 @@ class RegexScanner:
         self.data_elements_dir = Path(data_elements_dir)
         self.data_elements = []
         self.last_scan_usage = {}
+        self.last_scan_stats = {}
+        # RE2 prefiltering is used when google-re2 is installed; set
+        # TRUSCANNER_REGEX_ENGINE=re to always scan with the stdlib alone.
+        self.use_re2 = _HAS_RE2 and os.environ.get("TRUSCANNER_REGEX_ENGINE", "").lower() != "re"
+        self._pattern_tables = None
+        self._pattern_tables_key = None
+        self._pattern_tables_lock = threading.Lock()
         if load_immediately:
             self._load_data_elements()
 
     def _load_data_elements(self):
-        """Load patterns from JSON files."""
-        if self.data_elements_dir.exists():
-            for json_file in self.data_elements_dir.rglob("*.json"):
-                self._parse_json_file(json_file)
+        """Load patterns from JSON files, reusing definitions already compiled."""
+        if not self.data_elements_dir.exists():
+            return
+
+        json_files = list(self.data_elements_dir.rglob("*.json"))
+        try:
+            fingerprint = tuple(
+                (str(json_file), stat.st_mtime_ns, stat.st_size)
+                for json_file, stat in ((f, f.stat()) for f in json_files)
+            )
+        except OSError:
+            fingerprint = None
+
+        cache_key = (type(self), str(self.data_elements_dir.resolve()))
+        if fingerprint is not None:
+            with self._ELEMENTS_CACHE_LOCK:
+                cached = self._ELEMENTS_CACHE.get(cache_key)
+            if cached is not None and cached[0] == fingerprint:
+                self.data_elements.extend(cached[1])
+                return
+
+        start = len(self.data_elements)
+        for json_file in json_files:
+            self._parse_json_file(json_file)
+
+        if fingerprint is not None:
+            with self._ELEMENTS_CACHE_LOCK:
+                self._ELEMENTS_CACHE[cache_key] = (fingerprint, self.data_elements[start:])
 
     def _parse_json_file(self, json_file: Path):
         try:
@@ -96,7 +592,7 @@ class RegexScanner:
                 keywords = set()
                 for pattern in source.get("patterns", []):
                     try:
-                        compiled_patterns.append(re.compile(pattern))
+                        compiled_patterns.append(_compile(pattern))
                         # Extract words of 3+ chars as potential keywords for skipping
                         clean_pattern = re.sub(r'\\[a-zA-Z]', ' ', pattern)
                         words = re.findall(r'[a-zA-Z]{3,}', clean_pattern)
@@ -121,16 +617,64 @@ class RegexScanner:
         except Exception as e:
             logger.error("Error loading {}: {}", json_file, e)
 
+    def _get_pattern_tables(self) -> _PatternTables:
+        """Return lookup tables for the loaded elements, rebuilt when they change."""
+        # Keyed on the element objects themselves, so replacing an element or
+        # the whole list is noticed even when the length stays the same.
+        key = tuple(self.data_elements)
+        if not _same_elements(self._pattern_tables_key, key):
+            with self._pattern_tables_lock:
+                if not _same_elements(self._pattern_tables_key, key):
+                    self._pattern_tables = self._shared_pattern_tables(key)
+                    self._pattern_tables_key = key
+        return self._pattern_tables
+
+    def _shared_pattern_tables(self, elements: tuple) -> _PatternTables:
+        """Return tables for ``elements``, reusing ones built by another scanner."""
+        with self._ELEMENTS_CACHE_LOCK:
+            cached = self._TABLES_CACHE.get(self.use_re2)
+        if cached is not None and _same_elements(cached[0], elements):
+            return cached[1]
+
+        tables = _PatternTables(list(elements), self.use_re2)
+        with self._ELEMENTS_CACHE_LOCK:
+            self._TABLES_CACHE[self.use_re2] = (elements, tables)
+        return tables
+
+    def _get_prefilter(self) -> Optional[_RE2Prefilter]:
+        """Return the RE2 prefilter for the loaded elements, if enabled."""
+        return self._get_pattern_tables().prefilter
+
     def _is_false_positive(self, line_content: str, matched_text: str, match_start: int, line_start: int) -> bool:
         """Check if a match is likely a false positive."""
+        return (
+            self._is_false_positive_line(line_content)
+            or self._is_false_positive_match(line_content, matched_text, match_start, line_start)
+        )
+
+    @staticmethod
+    def _is_false_positive_line(line_content: str) -> bool:
+        """Checks that depend only on the line, so scan_text can cache them per line."""
         line_lower = line_content.lower()
-        matched_lower = matched_text.lower().strip()
-        line_stripped = line_content.strip()
 
         # Skip entire lines that are comments (start with //, #, /*, or *)
-        if line_stripped.startswith(("//", "#", "/*", "*/", "*")):
+        if line_content.strip().startswith(("//", "#", "/*", "*/", "*")):
             return True
 
+        # Skip HTML attributes and CSS values, CSS font-family and similar
+        if _FP_MARKUP.search(line_lower):
+            return True
+
+        # Skip if match is in a string that's clearly not personal data
+        if _FP_QUOTED_FIELD.search(line_lower):
+            return True
+
+        return False
+
+    def _is_false_positive_match(self, line_content: str, matched_text: str, match_start: int, line_start: int) -> bool:
+        """Checks that depend on where and what the match is."""
+        matched_lower = matched_text.lower().strip()
+
         # Skip matches in single-line comments (both // and #)
         comment_idx = line_content.find("//")
         if comment_idx == -1:
@@ -150,31 +694,16 @@ class RegexScanner:
             if comment_end == -1 or comment_end > match_start - line_start:
                 return True
 
-        # Skip HTML attributes and CSS values
-        if any(html_attr in line_lower for html_attr in [
-            'device-width', 'device-height', 'apple-touch-icon',
-            'viewport', 'meta name', 'content=', 'rel='
-        ]):
-            return True
-
-        # Skip CSS font-family and similar
-        if 'font-family' in line_lower or 'google fonts' in line_lower:
-            return True
-
         # Skip common false positives for device, google, apple
         if matched_lower in ['device', 'google', 'apple']:
-            if any(term in line_lower for term in ['width', 'height', 'touch-icon', 'font', 'meta']):
+            if _FP_DEVICE_CONTEXT.search(line_content.lower()):
                 return True
 
         # Calculate position in line
         match_pos = match_start - line_start
 
-        # Skip if match is in a string that's clearly not personal data
-        if re.search(r'["\']\s*(email|phone|name|address)\s*(field|column|attribute|property)', line_lower):
-            return True
-
         # Skip SQL field names (SELECT, INSERT, UPDATE statements) - field names only
-        if re.search(r'\b(SELECT|INSERT\s+INTO|UPDATE\s+\w+\s+SET)\s+', line_content, re.IGNORECASE):
+        if _FP_SQL_STATEMENT.search(line_content):
             if '"' in line_content or "'" in line_content:
                 quote_start = max(line_content.rfind('"', 0, match_pos), line_content.rfind("'", 0, match_pos))
                 quote_end = min(
@@ -184,34 +713,19 @@ class RegexScanner:
                 if quote_start != -1 and quote_end > match_pos:
                     return True
 
-        # Skip function parameters that are just variable names
-        if re.search(r'\bfunction\s+\w+\s*\([^)]*\b' + re.escape(matched_text) + r'\b', line_content, re.IGNORECASE):
-            return True
-
-        # Skip object property definitions without actual values (empty strings, null, undefined)
-        if re.search(r'\b' + re.escape(matched_text) + r'\s*[:=]\s*["\']?\s*[,}]', line_content, re.IGNORECASE):
-            return True
-
-        # Skip return statements with just variable names
-        if re.search(r'\breturn\s+' + re.escape(matched_text) + r'\s*[;,]', line_content, re.IGNORECASE):
-            return True
-
         # Only match actual email addresses (with @), not just the word "email"
         if matched_lower == "email" and "@" not in line_content:
-            if not re.search(r'email\s*[:=]\s*["\']?[^"\']*@', line_content, re.IGNORECASE):
+            if not _FP_EMAIL_VALUE.search(line_content):
                 return True
 
         # Only match actual phone numbers (with digits), not just the word "phone"
-        if matched_lower in ["phone", "mobile"] and not re.search(r'\d{6,}', line_content):
-            if not re.search(r'(phone|mobile)\s*[:=]\s*["\']?[^"\']*\d{6,}', line_content, re.IGNORECASE):
+        if matched_lower in ["phone", "mobile"] and not _FP_PHONE_DIGITS.search(line_content):
+            if not _FP_PHONE_VALUE.search(line_content):
                 return True
 
-        # Skip variable declarations without actual values (just variable names)
-        if re.search(r'\b(const|let|var)\s+' + re.escape(matched_text) + r'\s*[;,]', line_content, re.IGNORECASE):
-            return True
-
-        # Only match if there's actual data — skip assignments without a value
-        if re.search(r'\b' + re.escape(matched_text) + r'\s*=\s*["\']?\s*[;,\n]', line_content, re.IGNORECASE):
+        # Skip bare variable names: function parameters, valueless properties,
+        # declarations and assignments, and return statements
+        if _fp_matched_text_pattern(matched_text).search(line_content):
             return True
 
         return False
@@ -222,27 +736,60 @@ class RegexScanner:
         if not text:
             return findings
 
-        # Precompute line start offsets for fast offset-to-line lookup
-        line_starts = [0]
-        for match in re.finditer(r'\n', text):
-            line_starts.append(match.end())
-
-        lines = None  # Lazy split if needed
-        text_lower = None
-
-        for element in self.data_elements:
-            # OPTIMIZATION: Skip element if none of its keywords are in the text
-            if element.get("keywords"):
-                if text_lower is None:
-                    text_lower = text.lower()
-                if not any(kw in text_lower for kw in element["keywords"]):
+        # Line start offsets for offset-to-line lookup, built on the first match
+        line_starts = None
+
+        tables = self._get_pattern_tables()
+        shared_patterns = tables.shared_patterns
+        # Keywords present in the text, found in one pass, select the elements
+        # to run; elements without keywords always run.
+        data_elements = self.data_elements
+        if tables.keyword_elements:
+            hit_keywords = tables.keyword_index.hits(text.lower())
+            if not hit_keywords and tables.all_gated:
+                return findings
+            active = set(tables.ungated)
+            for keyword in hit_keywords:
+                active.update(tables.keyword_elements[keyword])
+            element_indices = sorted(active)
+        else:
+            element_indices = range(len(data_elements))
+
+        prefilter = tables.prefilter
+        candidates = prefilter.candidates(text) if prefilter is not None else None
+        # Matches of patterns used by several elements, computed once per text.
+        shared_matches = {}
+        line_cache = {}
+        match_fp_cache = {}
+        # Most source files are ASCII; their matches are the same under re.ASCII.
+        ascii_text = text.isascii() and not _ASCII_MODE_UNSAFE_CHARS.search(text)
+
+        for index in element_indices:
+            element = data_elements[index]
+            patterns = element["patterns"]
+            if candidates is not None:
+                patterns = [p for p in patterns if p in candidates]
+                if not patterns:
                     continue
 
             matched_lines_for_element = set()
-            for pattern in element["patterns"]:
-                for match in pattern.finditer(text):
+            # Patterns run one at a time, in definition order: the first
+            # pattern to hit a line decides its finding, and a merged
+            # alternation is slower under ``re`` (it loses each pattern's
+            # literal-prefix search).
+            for pattern in patterns:
+                matcher = _ascii_variant(pattern) if ascii_text else pattern
+                if pattern in shared_patterns:
+                    matches = shared_matches.get(pattern)
+                    if matches is None:
+                        matches = shared_matches[pattern] = list(matcher.finditer(text))
+                else:
+                    matches = matcher.finditer(text)
+                for match in matches:
                     start_offset = match.start()
                     # Find line number (1-indexed)
+                    if line_starts is None:
+                        line_starts = _line_starts(text)
                     line_number = bisect.bisect_right(line_starts, start_offset)
 
                     # One match per element per line to match previous behavior
@@ -250,24 +797,39 @@ class RegexScanner:
                         continue
                     matched_lines_for_element.add(line_number)
 
-                    if lines is None:
-                        lines = text.splitlines()
-
-                    line_content = lines[line_number - 1] if line_number <= len(lines) else ""
-                    line_start = line_starts[line_number - 1] if line_number > 0 else 0
-                    line_stripped = line_content.strip()
-
-                    # Skip entire comment lines immediately
-                    if line_stripped.startswith(("//", "#", "/*", "*/", "*")):
+                    # The line, its stripped form and the line-level false-positive
+                    # checks (comment lines, markup, ...) are shared by every match
+                    # on it; match-level checks by every element reporting the same
+                    # span.
+                    line_info = line_cache.get(line_number)
+                    if line_info is None:
+                        line_start = line_starts[line_number - 1]
+                        line_end = line_starts[line_number] - 1 if line_number < len(line_starts) else len(text)
+                        line_content = text[line_start:line_end]
+                        if line_content.endswith('\r'):
+                            line_content = line_content[:-1]
+                        line_info = line_cache[line_number] = (
+                            line_start,
+                            line_content,
+                            line_content.strip(),
+                            self._is_false_positive_line(line_content),
+                        )
+                    line_start, line_content, line_stripped, line_fp = line_info
+                    if line_fp:
                         continue
 
-                    # Check for false positives
-                    if self._is_false_positive(line_content, match.group(0), start_offset, line_start):
+                    span = match.span()
+                    match_fp = match_fp_cache.get(span)
+                    if match_fp is None:
+                        match_fp = match_fp_cache[span] = self._is_false_positive_match(
+                            line_content, match.group(0), start_offset, line_start
+                        )
+                    if match_fp:
                         continue
 
                     findings.append({
                         "line_number": line_number,
-                        "line_content": line_content.strip(),
+                        "line_content": line_stripped,
                         "matched_text": match.group(0),
                         "element_name": element["name"],
                         "element_category": element["category"],
@@ -280,9 +842,7 @@ class RegexScanner:
     def scan_file(self, filepath: str) -> List[Dict[str, Any]]:
         """Scan a single file and return findings."""
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
+            content = _read_source_file(filepath)
             findings = self.scan_text(content, context=filepath)
 
             for finding in findings:
@@ -299,9 +859,27 @@ class RegexScanner:
         extensions: Optional[List[str]] = None,
         exclude_dirs: Optional[set] = None,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        processes: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Recursively scan directory or file for data elements using parallel I/O."""
+        """Recursively scan directory or file for data elements in parallel.
+
+        Files are scanned on a thread pool by default. With ``processes`` > 1
+        (or ``TRUSCANNER_SCAN_PROCESSES``) and at least
+        ``PROCESS_POOL_MIN_FILES`` files, they are spread over up to that many
+        forked worker processes instead, one per
+        ``PROCESS_POOL_FILES_PER_WORKER`` files and never more than the CPU
+        count, since matching is CPU-bound. Where workers would have to be
+        spawned rather than forked (Windows, macOS, or a parent that already
+        runs other threads) start-up costs seconds, so the scan stays on
+        threads unless ``TRUSCANNER_SCAN_PROCESSES`` asks for processes; scripts
+        that set it there need the usual ``if __name__ == "__main__":`` guard.
+
+        Per-scan counters (``files_scanned``, ``files_with_findings``) are
+        left in ``self.last_scan_stats`` so callers don't need another pass
+        over the findings to derive them.
+        """
         self.last_scan_usage = {}
+        self.last_scan_stats = {"files_scanned": 0, "files_with_findings": 0}
         path = Path(directory)
 
         if not path.exists():
@@ -309,7 +887,12 @@ class RegexScanner:
             return []
 
         if path.is_file():
-            return self.scan_file(str(path))
+            findings = self.scan_file(str(path))
+            self.last_scan_stats = {
+                "files_scanned": 1,
+                "files_with_findings": 1 if findings else 0,
+            }
+            return findings
 
         effective_exclude_dirs = exclude_dirs or self.DEFAULT_EXCLUDE_DIRS
         exclude_files = self.DEFAULT_EXCLUDE_FILES
@@ -320,27 +903,60 @@ class RegexScanner:
             else self.DEFAULT_CODE_EXTENSIONS
         )
 
-        files_to_scan = []
-        # followlinks=False (default) prevents symlink loops
-        for root, dirs, files in os.walk(path, followlinks=False):
-            dirs[:] = [d for d in dirs if d not in effective_exclude_dirs and not d.startswith('.')]
-
-            for file in files:
-                if file.startswith('.') or file in exclude_files:
-                    continue
-
-                file_ext = Path(file).suffix.lower()
-                if file_ext in exclude_exts:
-                    continue
-                if file_ext not in allowed_extensions:
-                    continue
-
-                files_to_scan.append(os.path.join(root, file))
+        files_to_scan = list(_iter_files(
+            path, effective_exclude_dirs, exclude_files, exclude_exts, allowed_extensions
+        ))
 
         if not self.data_elements:
             self._load_data_elements()
 
+        total_files = len(files_to_scan)
+        forced_processes = False
+        env_processes = os.environ.get("TRUSCANNER_SCAN_PROCESSES")
+        if env_processes:
+            try:
+                processes = int(env_processes)
+                forced_processes = True
+            except ValueError:
+                pass
+
+        workers = min(
+            processes or 1,
+            os.cpu_count() or 1,
+            total_files // self.PROCESS_POOL_FILES_PER_WORKER,
+        )
+        if not forced_processes and not _can_fork_workers():
+            workers = 1
+        per_file_findings = None
+        if workers > 1 and total_files >= self.PROCESS_POOL_MIN_FILES:
+            try:
+                per_file_findings = self._scan_files_in_processes(
+                    files_to_scan, workers, progress_callback
+                )
+            except Exception as e:
+                logger.warning("Process pool scan failed, falling back to threads: {}", e)
+        if per_file_findings is None:
+            per_file_findings = self._scan_files_in_threads(files_to_scan, progress_callback)
+
         all_findings = []
+        files_with_findings = 0
+        for file_findings in per_file_findings:
+            if file_findings:
+                files_with_findings += 1
+                all_findings.extend(file_findings)
+
+        self.last_scan_stats = {
+            "files_scanned": total_files,
+            "files_with_findings": files_with_findings,
+        }
+        return all_findings
+
+    def _scan_files_in_threads(
+        self,
+        files_to_scan: List[str],
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> List[List[Dict[str, Any]]]:
+        per_file_findings = []
         total_files = len(files_to_scan)
         completed = 0
         lock = threading.Lock()
@@ -361,11 +977,52 @@ class RegexScanner:
                         pass
 
                 try:
-                    all_findings.extend(future.result())
+                    per_file_findings.append(future.result())
                 except Exception as e:
                     logger.error("Error processing {}: {}", fp, e)
 
-        return all_findings
+        return per_file_findings
+
+    def _scan_files_in_processes(
+        self,
+        files_to_scan: List[str],
+        workers: int,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> List[List[Dict[str, Any]]]:
+        total_files = len(files_to_scan)
+        # Several chunks per worker keeps the pool busy while still reporting progress.
+        chunk_size = max(1, min(64, total_files // (workers * 4)))
+        chunks = [files_to_scan[i:i + chunk_size] for i in range(0, total_files, chunk_size)]
+
+        # Forked workers inherit the compiled elements and lookup tables as
+        # they are; spawned ones rebuild the tables from the elements.
+        if _can_fork_workers():
+            context = multiprocessing.get_context("fork")
+            pattern_tables = self._get_pattern_tables()
+        else:
+            context = multiprocessing.get_context("spawn")
+            pattern_tables = None
+
+        per_file_findings = []
+        completed = 0
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_worker_init,
+            initargs=(type(self), self.data_elements, self.use_re2, pattern_tables),
+        ) as executor:
+            future_to_chunk = {executor.submit(_parallel_scan_files, chunk): chunk for chunk in chunks}
+            for future in as_completed(future_to_chunk):
+                per_file_findings.extend(future.result())
+                for fp in future_to_chunk[future]:
+                    completed += 1
+                    if progress_callback:
+                        try:
+                            progress_callback(completed, total_files, fp)
+                        except Exception:
+                            pass
+
+        return per_file_findings
 
     @staticmethod
     def _normalize_extensions(extensions: List[str]) -> set:
@@ -415,6 +1072,37 @@ class RegexScanner:
             f"  - **Total Tokens:** {token_usage.get('total_tokens', 0)}",
         ]
 
+    def summarize_findings(self, findings: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate findings once so every report format can share the result."""
+        if not self.data_elements:
+            self._load_data_elements()
+
+        category_details = defaultdict(Counter)
+        category_totals = Counter()
+        by_file = defaultdict(lambda: {"findings": [], "elements": set()})
+        detected_elements = set()
+        for f in findings:
+            element_name = f.get("element_name")
+            if element_name:
+                detected_elements.add(element_name)
+            category_details[f["element_category"]][f["element_name"]] += 1
+            category_totals[f["element_category"]] += 1
+            filename = f.get("filename", "Unknown")
+            by_file[filename]["findings"].append(f)
+            by_file[filename]["elements"].add(f.get("element_name", "Unknown"))
+
+        categories = [
+            (category, category_totals[category], category_details[category].most_common())
+            for category in sorted(category_details, key=category_totals.__getitem__, reverse=True)
+        ]
+
+        return {
+            "configured_elements": len(self.data_elements),
+            "distinct_detected_elements": len(detected_elements),
+            "categories": categories,
+            "files": sorted(by_file.items()),
+        }
+
     def generate_report(
         self,
         findings: List[Dict[str, Any]],
@@ -422,21 +1110,44 @@ class RegexScanner:
         report_id: Optional[str] = None,
         directory_scanned: Optional[str] = None,
         token_usage: Optional[Dict[str, Any]] = None,
-    ) -> str:
-        """Generate formatted text report from findings."""
-        if not self.data_elements:
-            self._load_data_elements()
-        configured_elements = len(self.data_elements)
-        distinct_detected_elements = len(
-            {
-                finding.get("element_name")
-                for finding in findings
-                if finding.get("element_name")
-            }
+        summary: Optional[Dict[str, Any]] = None,
+        writer: Optional[TextIO] = None,
+    ) -> Optional[str]:
+        """Generate formatted text report from findings.
+
+        With ``writer`` the report is written to it line by line instead of
+        being built in memory, and None is returned.
+        """
+        lines = self._report_lines(
+            findings,
+            duration=duration,
+            report_id=report_id,
+            directory_scanned=directory_scanned,
+            token_usage=token_usage,
+            summary=summary,
         )
+        if writer is None:
+            return "\n".join(lines)
+        _write_lines(writer, lines)
+        return None
+
+    def _report_lines(
+        self,
+        findings: List[Dict[str, Any]],
+        duration: Optional[float] = None,
+        report_id: Optional[str] = None,
+        directory_scanned: Optional[str] = None,
+        token_usage: Optional[Dict[str, Any]] = None,
+        summary: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Yield the lines of the text report."""
+        if summary is None:
+            summary = self.summarize_findings(findings)
+        configured_elements = summary["configured_elements"]
+        distinct_detected_elements = summary["distinct_detected_elements"]
 
         if not findings:
-            lines = [
+            yield from [
                 "truconsent (truconsent.io)",
                 "",
                 "truscanner Report",
@@ -447,66 +1158,52 @@ class RegexScanner:
                 "Distinct Detected Elements: 0",
                 "Total Findings: 0",
             ]
-            lines.extend(self._token_usage_lines(token_usage))
-            lines.extend(["", "No data elements found."])
-            return "\n".join(lines)
-
-        lines = []
+            yield from self._token_usage_lines(token_usage)
+            yield ""
+            yield "No data elements found."
+            return
 
         # Header
-        lines.append("truconsent (truconsent.io)")
-        lines.append("")
-        lines.append("truscanner Report")
-        lines.append("")
+        yield "truconsent (truconsent.io)"
+        yield ""
+        yield "truscanner Report"
+        yield ""
 
         # Scan Report ID
         if report_id:
-            lines.append(f"Scan Report ID: {report_id}")
-            lines.append("")
+            yield f"Scan Report ID: {report_id}"
+            yield ""
 
         # Summary
-        lines.append("Summary")
-        lines.append("-" * 80)
-        lines.append(f"Configured Data Elements: {configured_elements}")
-        lines.append(f"Distinct Detected Elements: {distinct_detected_elements}")
-        lines.append(f"Total Findings: {len(findings)}")
+        yield "Summary"
+        yield "-" * 80
+        yield f"Configured Data Elements: {configured_elements}"
+        yield f"Distinct Detected Elements: {distinct_detected_elements}"
+        yield f"Total Findings: {len(findings)}"
         if duration is not None:
-            lines.append(f"Time Taken: {duration:.2f} seconds")
-        lines.extend(self._token_usage_lines(token_usage))
-        lines.append("")
+            yield f"Time Taken: {duration:.2f} seconds"
+        yield from self._token_usage_lines(token_usage)
+        yield ""
 
         # Summary by Category
-        category_details = defaultdict(lambda: defaultdict(int))
-        for f in findings:
-            category_details[f["element_category"]][f["element_name"]] += 1
-
-        lines.append("Summary by Category")
-        lines.append("-" * 80)
-        for category, elements in sorted(category_details.items(), key=lambda x: sum(x[1].values()), reverse=True):
-            total_count = sum(elements.values())
-            distinct_count = len(elements)
-            lines.append(f"\n{category}")
-            lines.append(f"  Total: {total_count} ({distinct_count} distinctive elements)")
-            for name, count in sorted(elements.items(), key=lambda x: x[1], reverse=True):
-                lines.append(f"    - {name}: {count}")
-        lines.append("")
-        lines.append("-" * 80)
-        lines.append("")
-
-        # Group by file and collect unique element names
-        by_file = defaultdict(lambda: {"findings": [], "elements": set()})
-        for f in findings:
-            filename = f.get("filename", "Unknown")
-            by_file[filename]["findings"].append(f)
-            by_file[filename]["elements"].add(f.get("element_name", "Unknown"))
+        yield "Summary by Category"
+        yield "-" * 80
+        for category, total_count, elements in summary["categories"]:
+            yield f"\n{category}"
+            yield f"  Total: {total_count} ({len(elements)} distinctive elements)"
+            for name, count in elements:
+                yield f"    - {name}: {count}"
+        yield ""
+        yield "-" * 80
+        yield ""
 
         # Create table
-        lines.append("Tables")
-        lines.append("-" * 80)
-        lines.append(f"{'S.No':<8} {'File Path':<50} {'Total No. Data Element':<25} {'Data Elements'}")
-        lines.append("-" * 80)
+        yield "Tables"
+        yield "-" * 80
+        yield f"{'S.No':<8} {'File Path':<50} {'Total No. Data Element':<25} {'Data Elements'}"
+        yield "-" * 80
 
-        sorted_files = sorted(by_file.items())
+        sorted_files = summary["files"]
         for idx, (filename, file_data) in enumerate(sorted_files, 1):
             total_elements = len(file_data["elements"])
             element_pills = " ".join(f"[{elem}]" for elem in sorted(file_data["elements"]))
@@ -515,39 +1212,36 @@ class RegexScanner:
             display_filename = self._strip_directory_prefix(filename, directory_scanned)
             if len(display_filename) > 50:
                 display_filename = display_filename[:47] + "..."
-            lines.append(f"{idx:<8} {display_filename:<50} {total_elements:<25} {element_pills}")
+            yield f"{idx:<8} {display_filename:<50} {total_elements:<25} {element_pills}"
 
-        lines.append("-" * 80)
-        lines.append("")
+        yield "-" * 80
+        yield ""
 
         # Findings (detailed)
-        lines.append("Findings")
-        lines.append("-" * 80)
+        yield "Findings"
+        yield "-" * 80
 
         for filename, file_data in sorted_files:
             display_filename = self._strip_directory_prefix(filename, directory_scanned)
-            lines.append(f"\nFile: {display_filename}")
-            lines.append(f"Found {len(file_data['findings'])} data element(s)")
-            lines.append("")
+            yield f"\nFile: {display_filename}"
+            yield f"Found {len(file_data['findings'])} data element(s)"
+            yield ""
 
+            # One multi-line string per finding keeps yields and writes few.
             for finding in file_data["findings"]:
-                lines.extend([
-                    f"  Line {finding.get('line_number', 'Unknown')}: {finding.get('element_name', 'Unknown')}",
-                    f"    Category: {finding.get('element_category', 'Unknown')}",
-                    f"    Matched: {finding.get('matched_text', 'N/A')}",
-                    f"    Context: {str(finding.get('line_content', ''))[:100]}",
-                    f"    Detected By: {finding.get('source', 'Regex')}"
-                ])
-
+                block = (
+                    f"  Line {finding.get('line_number', 'Unknown')}: {finding.get('element_name', 'Unknown')}\n"
+                    f"    Category: {finding.get('element_category', 'Unknown')}\n"
+                    f"    Matched: {finding.get('matched_text', 'N/A')}\n"
+                    f"    Context: {str(finding.get('line_content', ''))[:100]}\n"
+                    f"    Detected By: {finding.get('source', 'Regex')}\n"
+                )
                 if finding.get("tags"):
                     tags = ", ".join(f"{k}: {v}" for k, v in finding["tags"].items())
-                    lines.append(f"    Tags: {tags}")
-
-                lines.append("")
+                    block += f"    Tags: {tags}\n"
+                yield block
 
-            lines.append("-" * 80)
-
-        return "\n".join(lines)
+            yield "-" * 80
 
     def generate_markdown_report(
         self,
@@ -556,21 +1250,44 @@ class RegexScanner:
         report_id: Optional[str] = None,
         directory_scanned: Optional[str] = None,
         token_usage: Optional[Dict[str, Any]] = None,
-    ) -> str:
-        """Generate formatted markdown report from findings."""
-        if not self.data_elements:
-            self._load_data_elements()
-        configured_elements = len(self.data_elements)
-        distinct_detected_elements = len(
-            {
-                finding.get("element_name")
-                for finding in findings
-                if finding.get("element_name")
-            }
+        summary: Optional[Dict[str, Any]] = None,
+        writer: Optional[TextIO] = None,
+    ) -> Optional[str]:
+        """Generate formatted markdown report from findings.
+
+        With ``writer`` the report is written to it line by line instead of
+        being built in memory, and None is returned.
+        """
+        lines = self._markdown_report_lines(
+            findings,
+            duration=duration,
+            report_id=report_id,
+            directory_scanned=directory_scanned,
+            token_usage=token_usage,
+            summary=summary,
         )
+        if writer is None:
+            return "\n".join(lines)
+        _write_lines(writer, lines)
+        return None
+
+    def _markdown_report_lines(
+        self,
+        findings: List[Dict[str, Any]],
+        duration: Optional[float] = None,
+        report_id: Optional[str] = None,
+        directory_scanned: Optional[str] = None,
+        token_usage: Optional[Dict[str, Any]] = None,
+        summary: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Yield the lines of the markdown report."""
+        if summary is None:
+            summary = self.summarize_findings(findings)
+        configured_elements = summary["configured_elements"]
+        distinct_detected_elements = summary["distinct_detected_elements"]
 
         if not findings:
-            lines = [
+            yield from [
                 "truconsent (truconsent.io)",
                 "",
                 "# truscanner Report",
@@ -581,70 +1298,56 @@ class RegexScanner:
                 "- **Distinct Detected Elements:** 0",
                 "- **Total Findings:** 0",
             ]
-            lines.extend(self._token_usage_markdown_lines(token_usage))
-            lines.extend(["", "No data elements found."])
-            return "\n".join(lines)
-
-        lines = []
+            yield from self._token_usage_markdown_lines(token_usage)
+            yield ""
+            yield "No data elements found."
+            return
 
         # Header
-        lines.append("truconsent (truconsent.io)")
-        lines.append("")
-        lines.append("# truscanner Report")
-        lines.append("")
+        yield "truconsent (truconsent.io)"
+        yield ""
+        yield "# truscanner Report"
+        yield ""
 
         if report_id:
-            lines.append(f"**Scan Report ID:** {report_id}")
-            lines.append("")
-
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- **Configured Data Elements:** {configured_elements}")
-        lines.append(f"- **Distinct Detected Elements:** {distinct_detected_elements}")
-        lines.append(f"- **Total Findings:** {len(findings)}")
+            yield f"**Scan Report ID:** {report_id}"
+            yield ""
+
+        yield "## Summary"
+        yield ""
+        yield f"- **Configured Data Elements:** {configured_elements}"
+        yield f"- **Distinct Detected Elements:** {distinct_detected_elements}"
+        yield f"- **Total Findings:** {len(findings)}"
         if duration is not None:
-            lines.append(f"- **Time Taken:** {duration:.2f} seconds")
+            yield f"- **Time Taken:** {duration:.2f} seconds"
         if directory_scanned:
-            lines.append(f"- **Directory Scanned:** {directory_scanned}")
+            yield f"- **Directory Scanned:** {directory_scanned}"
         if token_usage:
-            lines.append(f"- **Tokenizer:** {token_usage.get('tokenizer', 'unknown')}")
-            lines.append(f"- **Files Scanned:** {token_usage.get('files_scanned', 0)}")
-            lines.append(f"- **Input Tokens:** {token_usage.get('input_tokens', 0)}")
-            lines.append(f"- **Output Tokens:** {token_usage.get('output_tokens', 0)}")
-            lines.append(f"- **Total Tokens:** {token_usage.get('total_tokens', 0)}")
-        lines.append("")
+            yield f"- **Tokenizer:** {token_usage.get('tokenizer', 'unknown')}"
+            yield f"- **Files Scanned:** {token_usage.get('files_scanned', 0)}"
+            yield f"- **Input Tokens:** {token_usage.get('input_tokens', 0)}"
+            yield f"- **Output Tokens:** {token_usage.get('output_tokens', 0)}"
+            yield f"- **Total Tokens:** {token_usage.get('total_tokens', 0)}"
+        yield ""
 
         # Summary by Category
-        category_details = defaultdict(lambda: defaultdict(int))
-        for f in findings:
-            category_details[f["element_category"]][f["element_name"]] += 1
-
-        lines.append("## Summary by Category")
-        lines.append("")
-        for category, elements in sorted(category_details.items(), key=lambda x: sum(x[1].values()), reverse=True):
-            total_count = sum(elements.values())
-            distinct_count = len(elements)
-            lines.append(f"### {category}")
-            lines.append("")
-            lines.append(f"- **Total:** {total_count} ({distinct_count} distinctive elements)")
-            lines.append("")
-            for name, count in sorted(elements.items(), key=lambda x: x[1], reverse=True):
-                lines.append(f"  - {name}: {count}")
-            lines.append("")
-
-        # Group by file and collect unique element names
-        by_file = defaultdict(lambda: {"findings": [], "elements": set()})
-        for f in findings:
-            filename = f.get("filename", "Unknown")
-            by_file[filename]["findings"].append(f)
-            by_file[filename]["elements"].add(f.get("element_name", "Unknown"))
-
-        lines.append("## Tables")
-        lines.append("")
-        lines.append("| S.No | File Path | Total No. Data Element | Data Elements |")
-        lines.append("|------|-----------|------------------------|----------------|")
-
-        sorted_files = sorted(by_file.items())
+        yield "## Summary by Category"
+        yield ""
+        for category, total_count, elements in summary["categories"]:
+            yield f"### {category}"
+            yield ""
+            yield f"- **Total:** {total_count} ({len(elements)} distinctive elements)"
+            yield ""
+            for name, count in elements:
+                yield f"  - {name}: {count}"
+            yield ""
+
+        yield "## Tables"
+        yield ""
+        yield "| S.No | File Path | Total No. Data Element | Data Elements |"
+        yield "|------|-----------|------------------------|----------------|"
+
+        sorted_files = summary["files"]
         for idx, (filename, file_data) in enumerate(sorted_files, 1):
             total_elements = len(file_data["elements"])
             element_pills = " ".join(f"`{elem}`" for elem in sorted(file_data["elements"]))
@@ -653,38 +1356,37 @@ class RegexScanner:
             display_filename = self._strip_directory_prefix(filename, directory_scanned)
             element_pills = element_pills.replace("|", "\\|")
             filename_escaped = display_filename.replace("|", "\\|")
-            lines.append(f"| {idx} | `{filename_escaped}` | {total_elements} | {element_pills} |")
+            yield f"| {idx} | `{filename_escaped}` | {total_elements} | {element_pills} |"
 
-        lines.append("")
+        yield ""
 
-        lines.append("## Findings")
-        lines.append("")
+        yield "## Findings"
+        yield ""
 
         for filename, file_data in sorted_files:
             display_filename = self._strip_directory_prefix(filename, directory_scanned)
-            lines.append(f"### File: `{display_filename}`")
-            lines.append("")
-            lines.append(f"**Found {len(file_data['findings'])} data element(s)**")
-            lines.append("")
+            yield f"### File: `{display_filename}`"
+            yield ""
+            yield f"**Found {len(file_data['findings'])} data element(s)**"
+            yield ""
 
+            # One multi-line string per finding keeps yields and writes few.
             for finding in file_data["findings"]:
-                lines.append(f"#### Line {finding.get('line_number', 'Unknown')}: {finding.get('element_name', 'Unknown')}")
-                lines.append("")
-                lines.append(f"- **Category:** {finding.get('element_category', 'Unknown')}")
-                lines.append(f"- **Matched:** `{finding.get('matched_text', 'N/A')}`")
-                lines.append(f"- **Context:** `{str(finding.get('line_content', ''))[:100]}`")
-                lines.append(f"- **Detected By:** {finding.get('source', 'Regex')}")
-
+                block = (
+                    f"#### Line {finding.get('line_number', 'Unknown')}: {finding.get('element_name', 'Unknown')}\n"
+                    "\n"
+                    f"- **Category:** {finding.get('element_category', 'Unknown')}\n"
+                    f"- **Matched:** `{finding.get('matched_text', 'N/A')}`\n"
+                    f"- **Context:** `{str(finding.get('line_content', ''))[:100]}`\n"
+                    f"- **Detected By:** {finding.get('source', 'Regex')}\n"
+                )
                 if finding.get("tags"):
                     tags = ", ".join(f"{k}: {v}" for k, v in finding["tags"].items())
-                    lines.append(f"- **Tags:** {tags}")
-
-                lines.append("")
+                    block += f"- **Tags:** {tags}\n"
+                yield block
 
-            lines.append("---")
-            lines.append("")
-
-        return "\n".join(lines)
+            yield "---"
+            yield ""
 
     def generate_json_report(
         self,
@@ -693,18 +1395,13 @@ class RegexScanner:
         report_id: Optional[str] = None,
         directory_scanned: Optional[str] = None,
         token_usage: Optional[Dict[str, Any]] = None,
+        summary: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Generate JSON report with metadata."""
-        if not self.data_elements:
-            self._load_data_elements()
-        configured_elements = len(self.data_elements)
-        distinct_detected_elements = len(
-            {
-                finding.get("element_name")
-                for finding in findings
-                if finding.get("element_name")
-            }
-        )
+        if summary is None:
+            summary = self.summarize_findings(findings)
+        configured_elements = summary["configured_elements"]
+        distinct_detected_elements = summary["distinct_detected_elements"]
 
         return {
             "scan_report_id": report_id or "",
@@ -719,6 +1416,40 @@ class RegexScanner:
         }
 
 
+# ---------------------------------------------------------------------------
+# Process pool workers (module-level so they can be pickled)
+# ---------------------------------------------------------------------------
+
+_worker_scanner: Optional[RegexScanner] = None
+
+
+def _can_fork_workers() -> bool:
+    """Whether pool workers can be forked: only from a single-threaded parent on Linux."""
+    return sys.platform.startswith("linux") and threading.active_count() == 1
+
+
+def _worker_init(
+    scanner_cls,
+    data_elements: List[Dict[str, Any]],
+    use_re2: bool,
+    pattern_tables: Optional[_PatternTables] = None,
+) -> None:
+    """Set up the per-process scanner with the parent's loaded elements."""
+    global _worker_scanner
+    scanner = scanner_cls(load_immediately=False)
+    scanner.data_elements = data_elements
+    scanner.use_re2 = use_re2
+    if pattern_tables is not None:
+        scanner._pattern_tables = pattern_tables
+        scanner._pattern_tables_key = tuple(data_elements)
+    _worker_scanner = scanner
+
+
+def _parallel_scan_files(filepaths: List[str]) -> List[List[Dict[str, Any]]]:
+    """Scan a chunk of files in a worker process, one findings list per file."""
+    return [_worker_scanner.scan_file(fp) for fp in filepaths]
+
+
 def main():
     """CLI entry point for standalone usage."""
     if len(sys.argv) < 2:
@@ -727,20 +1458,20 @@ def main():
 
     scanner = RegexScanner()
 
-    start_time = time.time()
+    start_time = time.monotonic()
     findings = scanner.scan_directory(sys.argv[1])
-    duration = time.time() - start_time
-
-    report = scanner.generate_report(findings, duration=duration)
+    duration = time.monotonic() - start_time
 
     print(f"\nScanning: {sys.argv[1]}\n")
-    print(report)
 
+    # Stream the report to the file and the console in one pass.
     output_file = "regex_scan_report.txt"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(report)
+    with open(output_file, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+        scanner.generate_report(findings, duration=duration, writer=_Tee(f, sys.stdout))
+    print()
     print(f"\n✅ Report saved to: {output_file}")
 
 
 if __name__ == "__main__":
     main()
+
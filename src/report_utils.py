@@ -4,6 +4,10 @@ import hashlib
 import random
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List
+
+_INVALID_NAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r'\s+')
 
 
 def generate_report_id(directory_path: str) -> str:
@@ -22,8 +26,8 @@ def sanitize_directory_name(directory_path: str) -> str:
     # Get last part of path
     name = os.path.basename(os.path.normpath(directory_path))
     # Replace invalid chars
-    name = re.sub(r'[<>:"/\\|?*]', '_', name)
-    name = re.sub(r'\s+', '_', name)
+    name = _INVALID_NAME_CHARS.sub('_', name)
+    name = _WHITESPACE.sub('_', name)
     # Remove leading/trailing dots and underscores
     name = name.strip('._')
     # Ensure it's not empty
@@ -39,31 +43,47 @@ def get_reports_directory(base_dir: str = ".") -> Path:
     return reports_dir
 
 
-def get_next_report_filename(reports_subdir: Path, file_type: str, base_name: str = "truscan_report") -> str:
-    """Get next available filename with auto-increment."""
-    extensions = {"txt": ".txt", "md": ".md", "json": ".json"}
-    
-    if file_type not in extensions:
-        raise ValueError(f"Invalid file type: {file_type}")
-    
-    extension = extensions[file_type]
-    
-    # Check for base file (no number)
-    base_file = reports_subdir / f"{base_name}{extension}"
-    if not base_file.exists():
-        return f"{base_name}{extension}"
-    
-    # Find highest number
-    max_num = 0
-    pattern = re.compile(rf"^{re.escape(base_name)}(\d+){re.escape(extension)}$")
-    
-    for file in reports_subdir.iterdir():
-        if file.is_file():
-            match = pattern.match(file.name)
+REPORT_EXTENSIONS = {"txt": ".txt", "md": ".md", "json": ".json"}
+
+
+def get_next_report_filenames(reports_subdir: Path, file_types: List[str], base_name: str = "truscan_report") -> Dict[str, str]:
+    """Get the next available filename for each file type from one directory listing."""
+    for file_type in file_types:
+        if file_type not in REPORT_EXTENSIONS:
+            raise ValueError(f"Invalid file type: {file_type}")
+
+    try:
+        entries = list(os.scandir(reports_subdir))
+    except FileNotFoundError:
+        entries = []
+    existing = {entry.name for entry in entries}
+    existing_files = [entry.name for entry in entries if entry.is_file()]
+
+    filenames = {}
+    for file_type in file_types:
+        extension = REPORT_EXTENSIONS[file_type]
+
+        # Check for base file (no number)
+        if f"{base_name}{extension}" not in existing:
+            filenames[file_type] = f"{base_name}{extension}"
+            continue
+
+        # Find highest number
+        max_num = 0
+        pattern = re.compile(rf"^{re.escape(base_name)}(\d+){re.escape(extension)}$")
+        for name in existing_files:
+            match = pattern.match(name)
             if match:
                 max_num = max(max_num, int(match.group(1)))
-    
-    return f"{base_name}{max_num + 1}{extension}"
+
+        filenames[file_type] = f"{base_name}{max_num + 1}{extension}"
+
+    return filenames
+
+
+def get_next_report_filename(reports_subdir: Path, file_type: str, base_name: str = "truscan_report") -> str:
+    """Get next available filename with auto-increment."""
+    return get_next_report_filenames(reports_subdir, [file_type], base_name=base_name)[file_type]
 
 
 def create_reports_subdirectory(reports_dir: Path, directory_name: str) -> Path:
@@ -1,11 +1,11 @@
-import os
+import threading
 from pathlib import Path
 from typing import Callable, Dict, Any, List, Optional
 
 from loguru import logger
 
 from .ai_scanner import AIScanner
-from .regex_scanner import RegexScanner
+from .regex_scanner import RegexScanner, _iter_files, _read_source_file
 from .utils import has_bedrock_credentials, has_openai_credentials, normalize_ai_provider
 
 
@@ -13,8 +13,7 @@ def scan_file(filepath: str, regex_scanner: Optional[RegexScanner] = None) -> Li
     """Backward-compatible regex scan for a single file."""
     findings = []
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = _read_source_file(filepath)
 
         if regex_scanner:
             regex_findings = regex_scanner.scan_text(content, context=filepath)
@@ -41,15 +40,22 @@ def run_regex_scan(
     extensions: Optional[List[str]] = None,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
     regex_scanner: Optional[RegexScanner] = None,
+    processes: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """Run the regex/static scan only."""
+    """Run the regex/static scan only.
+
+    ``processes`` > 1 lets the scanner spread large scans over worker
+    processes (see :meth:`RegexScanner.scan_directory`).
+    """
     scanner = regex_scanner or RegexScanner()
     if hasattr(scanner, "scan_directory"):
-        return scanner.scan_directory(
-            directory,
-            extensions=extensions,
-            progress_callback=progress_callback,
-        )
+        scan_kwargs: Dict[str, Any] = {
+            "extensions": extensions,
+            "progress_callback": progress_callback,
+        }
+        if processes is not None:
+            scan_kwargs["processes"] = processes
+        return scanner.scan_directory(directory, **scan_kwargs)
 
     exclude_dirs = getattr(scanner, "DEFAULT_EXCLUDE_DIRS", RegexScanner.DEFAULT_EXCLUDE_DIRS)
     exclude_files = getattr(scanner, "DEFAULT_EXCLUDE_FILES", RegexScanner.DEFAULT_EXCLUDE_FILES)
@@ -70,17 +76,9 @@ def run_regex_scan(
     if path.is_file():
         files_to_scan = [str(path)]
     else:
-        for root, dirs, files in os.walk(directory, followlinks=False):
-            dirs[:] = [d for d in dirs if d not in exclude_dirs and not d.startswith('.')]
-            for file in files:
-                if file.startswith('.') or file in exclude_files:
-                    continue
-                file_ext = Path(file).suffix.lower()
-                if file_ext in exclude_exts:
-                    continue
-                if file_ext not in allowed_extensions:
-                    continue
-                files_to_scan.append(os.path.join(root, file))
+        files_to_scan = list(_iter_files(
+            directory, exclude_dirs, exclude_files, exclude_exts, allowed_extensions
+        ))
 
     results = []
     total = len(files_to_scan)
@@ -99,10 +97,15 @@ def run_ai_scan(
     model: Optional[str] = None,
     extensions: Optional[List[str]] = None,
     use_openai: bool = False,
+    concurrency: Optional[int] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> List[Dict[str, Any]]:
-    """Run the AI scan only with the selected provider."""
+    """Run the AI scan only with the selected provider.
+
+    Setting ``cancel_event`` stops the scan before its next file.
+    """
     provider = normalize_ai_provider(ai_provider)
-    scanner = AIScanner(ai_mode=ai_mode)
+    scanner = AIScanner(ai_mode=ai_mode, concurrency=concurrency)
 
     if provider == "openai":
         if not has_openai_credentials():
@@ -126,12 +129,16 @@ def run_ai_scan(
                 return []
             model = available_models[0]
 
+    scan_kwargs: Dict[str, Any] = {}
+    if cancel_event is not None:
+        scan_kwargs["cancel_event"] = cancel_event
     results = scanner.scan_directory(
         directory,
         provider=provider,
         use_openai=use_openai or provider == "openai",
         model=model,
         extensions=extensions,
+        **scan_kwargs,
     )
     run_ai_scan.last_usage = getattr(scanner, "last_scan_usage", {})
     return results
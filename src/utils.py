@@ -1,8 +1,11 @@
 """Utility functions for interactive menu, progress display, and backend integration."""
+import json
 import os
+import re
 import sys
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 
 import click
 import requests
@@ -22,6 +25,36 @@ except ImportError:
 BACKEND_URL = "https://d987tu7rq4.execute-api.ap-south-1.amazonaws.com"
 
 
+# Finding categories kept by --personal-only / personal_only=True. Matched as
+# substrings, so "Personal Identifiable Information (PII)" and AI-reported
+# variants count too.
+PERSONAL_CATEGORIES = [
+    "Personal Identifiable Information",
+    "PII",
+    "Contact Information",
+    "Government-Issued Identifiers",
+    "Authentication & Credentials",
+    "Health & Biometric Data",
+    "Sensitive Personal Data",
+]
+
+_PERSONAL_CATEGORY_RE = re.compile("|".join(re.escape(cat) for cat in PERSONAL_CATEGORIES))
+
+
+def is_personal_category(category: str) -> bool:
+    """Return True if *category* contains any of :data:`PERSONAL_CATEGORIES`."""
+    return _PERSONAL_CATEGORY_RE.search(category) is not None
+
+
+def filter_personal_findings(findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep only the findings whose category is a personal data category."""
+    return [
+        finding
+        for finding in findings
+        if is_personal_category(finding.get("element_category", ""))
+    ]
+
+
 AI_PROVIDER_CHOICES = [
     ("Skip AI scan", None),
     ("Ollama", "ollama"),
@@ -316,22 +349,19 @@ def show_progress(current: int, total: int, current_file: str):
     file_display = current_file[:50] + "..." if len(current_file) > 50 else current_file
     
     # Use ANSI escape codes to clear the line and move cursor to beginning
-    # This ensures we stay on one line
-    sys.stdout.write('\r\033[K')  # \r = return to start, \033[K = clear to end of line
-    sys.stdout.write(f'Scanning: {current}/{total} ({percentage:.1f}%) [{bar}] {file_display}')
-    sys.stdout.flush()
-    
+    # (\r = return to start, \033[K = clear to end of line) so we stay on one
+    # line. The whole update goes out in a single write + flush.
+    output = f'\r\033[KScanning: {current}/{total} ({percentage:.1f}%) [{bar}] {file_display}'
     if current == total:
-        sys.stdout.write('\n')  # New line only when complete
-        sys.stdout.flush()
-
+        output += '\n'  # New line only when complete
+    sys.stdout.write(output)
+    sys.stdout.flush()
 
-def upload_to_backend(scan_report_id: str, project_name: str, duration: float,
-                     total_findings: int, scan_data: List[Dict], files_scanned: int,
-                     metadata: Dict[str, Any]) -> bool:
-    """Upload scan results to backend API."""
-    base_url = BACKEND_URL.rstrip('/')
 
+def encode_upload_payload(scan_report_id: str, project_name: str, duration: float,
+                          total_findings: int, scan_data: List[Dict], files_scanned: int,
+                          metadata: Dict[str, Any]) -> bytes:
+    """Serialize the backend upload payload to UTF-8 JSON bytes."""
     payload = {
         "scan_report_id": scan_report_id,
         "project_name": project_name,
@@ -341,12 +371,46 @@ def upload_to_backend(scan_report_id: str, project_name: str, duration: float,
         "files_scanned": files_scanned,
         "metadata": metadata
     }
+    return json.dumps(payload).encode('utf-8')
+
+
+def upload_to_backend(scan_report_id: str, project_name: str, duration: float,
+                     total_findings: int, scan_data: List[Dict], files_scanned: int,
+                     metadata: Dict[str, Any],
+                     encoded_payload: Union[bytes, "Future[bytes]", None] = None) -> bool:
+    """Upload scan results to backend API.
+
+    Pass ``encoded_payload`` (from :func:`encode_upload_payload`, or a future
+    resolving to it) to reuse a payload that was already serialized, e.g. in
+    the background while the user was being prompted. Encoding errors are
+    reported like any other upload failure.
+    """
+    base_url = BACKEND_URL.rstrip('/')
+
+    try:
+        if isinstance(encoded_payload, Future):
+            encoded_payload = encoded_payload.result()
+        if encoded_payload is None:
+            encoded_payload = encode_upload_payload(
+                scan_report_id=scan_report_id,
+                project_name=project_name,
+                duration=duration,
+                total_findings=total_findings,
+                scan_data=scan_data,
+                files_scanned=files_scanned,
+                metadata=metadata,
+            )
+    except (TypeError, ValueError) as e:
+        logger.warning("Upload failed: could not encode scan results: {}", e)
+        print("\n❌ Server is busy, not stored right now!")
+        return False
 
     try:
         print("\nUploading ...")
         response = requests.post(
             f"{base_url}/api/scans/",
-            json=payload,
+            data=encoded_payload,
+            headers={"Content-Type": "application/json"},
             timeout=30,
         )
         response.raise_for_status()
@@ -1,6 +1,8 @@
 """Tests for src.ai_parser and AIScanner prompt/content preparation."""
 
 import json
+import threading
+import time
 
 import pytest
 
@@ -217,6 +219,27 @@ def test_prompt_uses_only_filename_not_full_path(tmp_path):
     assert "app.py" in prompt
 
 
+def test_prompts_share_the_same_prefix_across_files(tmp_path):
+    scanner = AIScanner(data_elements_dir=tmp_path)
+    first = scanner._get_prompt("a = 1", "src/a.py")
+    second = scanner._get_prompt("b = 2", "lib/b.js")
+
+    prefix = scanner._get_prompt_prefix()
+    assert first.startswith(prefix) and second.startswith(prefix)
+    assert "a.py" not in prefix
+    assert first.endswith("a = 1\n")
+
+
+def test_prompt_prefix_follows_in_place_name_changes(tmp_path):
+    scanner = AIScanner(data_elements_dir=tmp_path)
+    scanner.data_elements_names = ["Email Address"]
+    assert "Email Address" in scanner._get_prompt_prefix()
+
+    scanner.data_elements_names[0] = "Phone Number"
+    prefix = scanner._get_prompt_prefix()
+    assert "Phone Number" in prefix and "Email Address" not in prefix
+
+
 def test_prompt_includes_all_data_element_names(tmp_path):
     sources = [
         {"name": f"Element {idx}", "category": "Test", "patterns": [f"pattern_{idx}"]}
@@ -285,3 +308,65 @@ def test_ai_scanner_scan_file_missing_file_returns_empty(tmp_path):
     scanner = AIScanner(data_elements_dir=tmp_path)
     results = scanner.scan_file(str(tmp_path / "nonexistent.py"))
     assert results == []
+
+
+def test_ai_concurrency_env_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRUSCANNER_AI_CONCURRENCY", "4")
+    assert AIScanner(data_elements_dir=tmp_path).concurrency == 4
+    assert AIScanner(data_elements_dir=tmp_path, concurrency=0).concurrency == 1
+
+
+def test_ai_scan_directory_concurrent_keeps_file_order(tmp_path, monkeypatch):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for name in ("a.py", "b.py", "c.py", "d.py"):
+        (src_dir / name).write_text("x = 1\n", encoding="utf-8")
+
+    scanner = AIScanner(data_elements_dir=tmp_path / "empty", concurrency=4)
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def fake_scan_file(filepath, provider=None, use_openai=False, model=None):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return [{"filename": filepath}]
+
+    serial = AIScanner(data_elements_dir=tmp_path / "empty", concurrency=1)
+    monkeypatch.setattr(serial, "scan_file", fake_scan_file)
+    expected = serial.scan_directory(str(src_dir), provider="ollama", model="llama3")
+    assert in_flight[1] == 1
+
+    monkeypatch.setattr(scanner, "scan_file", fake_scan_file)
+    results = scanner.scan_directory(str(src_dir), provider="ollama", model="llama3")
+
+    assert results == expected
+    assert len(results) == 4
+    assert in_flight[1] > 1
+
+
+def test_ai_scan_directory_skips_files_once_cancelled(tmp_path, monkeypatch):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (src_dir / name).write_text("x = 1\n", encoding="utf-8")
+
+    scanner = AIScanner(data_elements_dir=tmp_path / "empty", concurrency=1)
+    cancel = threading.Event()
+    scanned = []
+
+    def fake_scan_file(filepath, provider=None, use_openai=False, model=None):
+        scanned.append(filepath)
+        cancel.set()
+        return [{"filename": filepath}]
+
+    monkeypatch.setattr(scanner, "scan_file", fake_scan_file)
+    results = scanner.scan_directory(
+        str(src_dir), provider="ollama", model="llama3", cancel_event=cancel
+    )
+
+    assert len(scanned) == 1
+    assert results == [{"filename": scanned[0]}]
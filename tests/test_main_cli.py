@@ -124,7 +124,7 @@ def _patch_main(monkeypatch, module, *, file_format="txt", ai_provider=None,
 # ---------------------------------------------------------------------------
 
 def test_scan_exits_zero_on_success(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -135,7 +135,7 @@ def test_scan_exits_zero_on_success(tmp_path, monkeypatch):
 
 
 def test_scan_prints_scanning_message(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -146,7 +146,7 @@ def test_scan_prints_scanning_message(tmp_path, monkeypatch):
 
 
 def test_scan_prints_report_id(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -157,7 +157,7 @@ def test_scan_prints_report_id(tmp_path, monkeypatch):
 
 
 def test_scan_prints_total_findings(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -168,7 +168,7 @@ def test_scan_prints_total_findings(tmp_path, monkeypatch):
 
 
 def test_scan_prints_time_taken(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -179,7 +179,7 @@ def test_scan_prints_time_taken(tmp_path, monkeypatch):
 
 
 def test_scan_prints_token_usage(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -190,7 +190,7 @@ def test_scan_prints_token_usage(tmp_path, monkeypatch):
 
 
 def test_scan_no_findings_still_exits_zero(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, regex_scanner_cls=DummyRegexScannerNoFindings)
@@ -202,34 +202,56 @@ def test_scan_no_findings_still_exits_zero(tmp_path, monkeypatch):
 
 
 def test_scan_nonexistent_directory_exits_nonzero(tmp_path):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     result = CliRunner().invoke(m.main, ["scan", str(tmp_path / "does_not_exist")])
     assert result.exit_code != 0
 
 
+def test_scan_throttles_progress_redraws(tmp_path, monkeypatch):
+    m = importlib.import_module("src.main")
+    project_dir = _make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    class ScannerWithManyFiles(DummyRegexScannerNoFindings):
+        def scan_directory(self, directory, progress_callback=None, **kwargs):
+            for current in range(1, 501):
+                progress_callback(current, 500, f"file_{current}.py")
+            return []
+
+    _patch_main(monkeypatch, m, regex_scanner_cls=ScannerWithManyFiles)
+    draws = []
+    monkeypatch.setattr(m, "show_progress", lambda *a: draws.append(a))
+
+    result = CliRunner().invoke(m.main, ["scan", str(project_dir)])
+
+    assert result.exit_code == 0, result.output
+    assert 1 <= len(draws) < 500
+    assert draws[-1][:2] == (500, 500)
+
+
 # ---------------------------------------------------------------------------
 # Flags: --version and --help
 # ---------------------------------------------------------------------------
 
 def test_version_flag(tmp_path):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     result = CliRunner().invoke(m.main, ["--version"])
     assert result.exit_code == 0
     assert "truscanner" in result.output.lower()
 
 
 def test_help_flag_shows_scan_command(tmp_path):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     result = CliRunner().invoke(m.main, ["--help"])
     assert result.exit_code == 0
     assert "scan" in result.output
 
 
 def test_scan_help_shows_options(tmp_path):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     result = CliRunner().invoke(m.main, ["scan", "--help"])
     assert result.exit_code == 0
-    for flag in ["--with-ai", "--ai-provider", "--ai-mode", "--personal-only"]:
+    for flag in ["--with-ai", "--ai-provider", "--ai-mode", "--ai-concurrency", "--personal-only"]:
         assert flag in result.output
 
 
@@ -238,7 +260,7 @@ def test_scan_help_shows_options(tmp_path):
 # ---------------------------------------------------------------------------
 
 def test_txt_format_creates_txt_file(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, file_format="txt")
@@ -249,7 +271,7 @@ def test_txt_format_creates_txt_file(tmp_path, monkeypatch):
 
 
 def test_md_format_creates_md_file(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, file_format="md")
@@ -260,7 +282,7 @@ def test_md_format_creates_md_file(tmp_path, monkeypatch):
 
 
 def test_json_format_creates_json_file(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, file_format="json")
@@ -274,7 +296,7 @@ def test_json_format_creates_json_file(tmp_path, monkeypatch):
 
 
 def test_all_format_creates_three_files(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, file_format="all")
@@ -288,7 +310,7 @@ def test_all_format_creates_three_files(tmp_path, monkeypatch):
 
 
 def test_report_path_shown_in_output(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, file_format="txt")
@@ -299,7 +321,7 @@ def test_report_path_shown_in_output(tmp_path, monkeypatch):
 
 
 def test_second_scan_increments_report_filename(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, file_format="txt")
@@ -317,7 +339,7 @@ def test_second_scan_increments_report_filename(tmp_path, monkeypatch):
 # ---------------------------------------------------------------------------
 
 def test_ai_provider_flag_skips_interactive_prompt(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
 
@@ -339,7 +361,7 @@ def test_ai_provider_flag_skips_interactive_prompt(tmp_path, monkeypatch):
 
 
 def test_ai_provider_openai_missing_credentials_shows_error(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -356,7 +378,7 @@ def test_ai_provider_openai_missing_credentials_shows_error(tmp_path, monkeypatc
 
 
 def test_ai_provider_bedrock_missing_credentials_shows_error(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m)
@@ -375,7 +397,7 @@ def test_ai_provider_bedrock_missing_credentials_shows_error(tmp_path, monkeypat
 
 
 def test_ai_provider_ollama_no_models_shows_error(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, ai_scanner_cls=DummyAIScanner)  # returns []
@@ -389,7 +411,7 @@ def test_ai_provider_ollama_no_models_shows_error(tmp_path, monkeypatch):
 
 
 def test_ai_provider_ollama_with_models_runs_ai_scan(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
 
@@ -410,7 +432,7 @@ def test_ai_provider_ollama_with_models_runs_ai_scan(tmp_path, monkeypatch):
 
 
 def test_ai_provider_openai_with_key_runs_ai_scan(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OPENAI_KEY", "sk-test")
@@ -425,7 +447,7 @@ def test_ai_provider_openai_with_key_runs_ai_scan(tmp_path, monkeypatch):
 
 
 def test_ai_provider_bedrock_with_credentials_shows_model_name(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("TRUSCANNER_ACCESS_KEY_ID", "AK")
@@ -445,7 +467,7 @@ def test_ai_provider_bedrock_with_credentials_shows_model_name(tmp_path, monkeyp
 # ---------------------------------------------------------------------------
 
 def test_ai_findings_creates_llm_report_file(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OPENAI_KEY", "sk-test")
@@ -468,7 +490,7 @@ def test_ai_findings_creates_llm_report_file(tmp_path, monkeypatch):
 
 
 def test_ai_no_findings_shows_no_additional_message(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OPENAI_KEY", "sk-test")
@@ -482,7 +504,7 @@ def test_ai_no_findings_shows_no_additional_message(tmp_path, monkeypatch):
 
 
 def test_ai_findings_count_shown_in_output(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OPENAI_KEY", "sk-test")
@@ -504,7 +526,7 @@ def test_ai_findings_count_shown_in_output(tmp_path, monkeypatch):
 
 def test_with_ai_flag_sets_ai_default(tmp_path, monkeypatch):
     """--with-ai should pass default_provider=None (not 'skip') to select_ai_provider."""
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
 
@@ -529,7 +551,7 @@ def test_with_ai_flag_sets_ai_default(tmp_path, monkeypatch):
 # ---------------------------------------------------------------------------
 
 def test_ai_mode_flag_passed_to_run_ai_scan(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OPENAI_KEY", "sk-test")
@@ -559,7 +581,7 @@ def test_ai_mode_flag_passed_to_run_ai_scan(tmp_path, monkeypatch):
 # ---------------------------------------------------------------------------
 
 def test_personal_only_filters_non_pii_findings(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
 
@@ -585,12 +607,40 @@ def test_personal_only_filters_non_pii_findings(tmp_path, monkeypatch):
     assert "Total Findings: 1" in result.output
 
 
+def test_personal_only_upload_counts_only_kept_files(tmp_path, monkeypatch):
+    m = importlib.import_module("src.main")
+    project_dir = _make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    class ScannerWithMixedFindings(DummyRegexScanner):
+        last_scan_stats = {"files_scanned": 3, "files_with_findings": 2}
+
+        def scan_directory(self, directory, progress_callback=None, **kwargs):
+            return [
+                {"filename": "a.py", "element_name": "Email",
+                 "element_category": "Contact Information"},
+                {"filename": "a.py", "element_name": "Phone",
+                 "element_category": "Contact Information"},
+                {"filename": "b.py", "element_name": "Device ID",
+                 "element_category": "Device Identifiers"},
+            ]
+
+    uploads = []
+    _patch_main(monkeypatch, m, regex_scanner_cls=ScannerWithMixedFindings, upload_answer="Y")
+    monkeypatch.setattr(m, "upload_to_backend", lambda **kw: uploads.append(kw) or True)
+
+    CliRunner().invoke(m.main, ["scan", str(project_dir), "--personal-only"])
+
+    assert uploads[0]["total_findings"] == 2
+    assert uploads[0]["files_scanned"] == 1
+
+
 # ---------------------------------------------------------------------------
 # Upload flow
 # ---------------------------------------------------------------------------
 
 def test_upload_prompt_n_does_not_call_upload(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
 
@@ -605,7 +655,7 @@ def test_upload_prompt_n_does_not_call_upload(tmp_path, monkeypatch):
 
 
 def test_upload_prompt_y_calls_upload(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
 
@@ -619,8 +669,26 @@ def test_upload_prompt_y_calls_upload(tmp_path, monkeypatch):
     assert upload_called
 
 
+def test_upload_receives_pre_encoded_payload(tmp_path, monkeypatch):
+    m = importlib.import_module("src.main")
+    project_dir = _make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    uploads = []
+    _patch_main(monkeypatch, m, upload_answer="Y")
+    monkeypatch.setattr(m, "upload_to_backend", lambda **kw: uploads.append(kw) or True)
+
+    CliRunner().invoke(m.main, ["scan", str(project_dir)])
+
+    assert len(uploads) == 1
+    payload = json.loads(uploads[0]["encoded_payload"].result().decode("utf-8"))
+    assert payload["scan_report_id"] == uploads[0]["scan_report_id"]
+    assert payload["total_findings"] == uploads[0]["total_findings"]
+    assert payload["project_name"] == "project"
+
+
 def test_upload_success_shows_dashboard_url(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, upload_answer="Y", upload_succeeds=True)
@@ -631,7 +699,7 @@ def test_upload_success_shows_dashboard_url(tmp_path, monkeypatch):
 
 
 def test_upload_failure_does_not_crash(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, upload_answer="Y", upload_succeeds=False)
@@ -646,7 +714,7 @@ def test_upload_failure_does_not_crash(tmp_path, monkeypatch):
 # ---------------------------------------------------------------------------
 
 def test_scan_cli_handles_missing_ollama_models_without_crashing(tmp_path, monkeypatch):
-    m = importlib.reload(importlib.import_module("src.main"))
+    m = importlib.import_module("src.main")
     project_dir = _make_project(tmp_path)
     monkeypatch.chdir(tmp_path)
     _patch_main(monkeypatch, m, ai_provider="ollama", ai_scanner_cls=DummyAIScanner)
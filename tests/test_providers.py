@@ -42,6 +42,29 @@ def test_run_with_progress_slow_fn_shows_spinner(capsys):
     assert "slow.py" in captured.out
 
 
+def test_run_with_progress_concurrent_calls_share_one_cleared_line(capsys):
+    import threading
+
+    both_running = threading.Barrier(2, timeout=5)
+
+    def slow():
+        both_running.wait()
+        time.sleep(0.25)
+
+    threads = [
+        threading.Thread(target=run_with_progress, args=(name, slow))
+        for name in ("short.py", "a/much/longer/path/file.py")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    out = capsys.readouterr().out
+    assert "AI Scanning: 2 files at once..." in out
+    assert all(chunk.startswith("\033[K") for chunk in out.split("\r")[1:])
+
+
 # ---------------------------------------------------------------------------
 # extract_message_content
 # ---------------------------------------------------------------------------
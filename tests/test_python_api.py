@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 import truscanner
 from truscanner.api import scan, scan_ai
 
@@ -159,7 +161,7 @@ def test_scan_prefers_openai_key_for_provider_detection(tmp_path, monkeypatch):
         def __init__(self, *args, **kwargs):
             self.data_elements = []
 
-    def fake_run_ai_scan(directory, ai_provider=None, ai_mode="balanced", model=None, extensions=None, use_openai=False):
+    def fake_run_ai_scan(directory, ai_provider=None, ai_mode="balanced", model=None, extensions=None, use_openai=False, cancel_event=None):
         captured["ai_provider"] = ai_provider
         captured["use_openai"] = use_openai
         return []
@@ -178,3 +180,109 @@ def test_scan_prefers_openai_key_for_provider_detection(tmp_path, monkeypatch):
     assert result["ai_model"] == "gpt-4o"
     assert captured["ai_provider"] == "openai"
     assert captured["use_openai"] is True
+
+
+def test_scan_with_ai_runs_regex_and_ai_scans_concurrently(tmp_path, monkeypatch):
+    import threading
+
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "main.py").write_text("print('ok')\n", encoding="utf-8")
+
+    # Each fake scan waits for the other one to start.
+    both_running = threading.Barrier(2, timeout=5)
+
+    class DummyRegexScanner:
+        def __init__(self, *args, **kwargs):
+            self.data_elements = []
+
+    def fake_run_regex_scan(*args, **kwargs):
+        both_running.wait()
+        return []
+
+    def fake_run_ai_scan(*args, **kwargs):
+        both_running.wait()
+        return []
+
+    monkeypatch.setattr("truscanner.api.RegexScanner", DummyRegexScanner)
+    monkeypatch.setattr("truscanner.api.run_regex_scan", fake_run_regex_scan)
+    monkeypatch.setattr("truscanner.api.run_ai_scan", fake_run_ai_scan)
+    monkeypatch.setattr("truscanner.api.generate_report_id", lambda _: "fixed-report-id")
+    monkeypatch.setenv("OPENAI_KEY", "test-openai-key")
+
+    result = scan(str(project_dir), with_ai=True)
+
+    assert result["scan_report_id"] == "fixed-report-id"
+    assert result["ai_provider"] == "openai"
+    assert result["ai_findings"] == []
+
+
+def test_scan_with_ai_raises_regex_failure_without_waiting_for_ai(tmp_path, monkeypatch):
+    import threading
+
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "main.py").write_text("print('ok')\n", encoding="utf-8")
+
+    ai_started = threading.Event()
+    release_ai = threading.Event()
+    ai_finished = threading.Event()
+    captured = {}
+
+    class DummyRegexScanner:
+        def __init__(self, *args, **kwargs):
+            self.data_elements = []
+
+    def failing_run_regex_scan(*args, **kwargs):
+        assert ai_started.wait(timeout=5)
+        raise RuntimeError("regex scan failed")
+
+    def slow_run_ai_scan(*args, **kwargs):
+        captured["cancel_event"] = kwargs.get("cancel_event")
+        ai_started.set()
+        release_ai.wait(timeout=5)
+        ai_finished.set()
+        return []
+
+    monkeypatch.setattr("truscanner.api.RegexScanner", DummyRegexScanner)
+    monkeypatch.setattr("truscanner.api.run_regex_scan", failing_run_regex_scan)
+    monkeypatch.setattr("truscanner.api.run_ai_scan", slow_run_ai_scan)
+    monkeypatch.setattr("truscanner.api.generate_report_id", lambda _: "fixed-report-id")
+    monkeypatch.setenv("OPENAI_KEY", "test-openai-key")
+
+    try:
+        with pytest.raises(RuntimeError, match="regex scan failed"):
+            scan(str(project_dir), with_ai=True)
+        # The AI scan is still blocked, so scan() did not wait for it.
+        assert not ai_finished.is_set()
+        # It was told to stop before its next file.
+        assert captured["cancel_event"].is_set()
+    finally:
+        release_ai.set()
+
+
+def test_import_truscanner_defers_loading_the_scanners():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, truscanner; truscanner.__version__; "
+        "print('src.main' in sys.modules, 'truscanner.api' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_scan_rejects_missing_path(tmp_path):
+    missing = tmp_path / "missing"
+    with pytest.raises(FileNotFoundError, match="Path not found"):
+        scan(str(missing))
+    with pytest.raises(FileNotFoundError, match="Path not found"):
+        scan(missing.as_uri())
@@ -1,13 +1,16 @@
 """Tests for src.regex_scanner — scanning, false positive detection, reports."""
 
+import io
 import json
 import os
+import sys
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
 
-from src.regex_scanner import RegexScanner
+from src.regex_scanner import RegexScanner, _KeywordIndex
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +34,61 @@ def scanner_with_email_pattern(tmp_path):
     return RegexScanner(data_elements_dir=tmp_path)
 
 
+# ---------------------------------------------------------------------------
+# Data element loading
+# ---------------------------------------------------------------------------
+
+def test_scanners_reuse_compiled_elements_for_same_directory(scanner_with_email_pattern, tmp_path):
+    second = RegexScanner(data_elements_dir=tmp_path)
+
+    assert second.data_elements
+    assert second.data_elements[0] is scanner_with_email_pattern.data_elements[0]
+
+
+def test_element_cache_reloads_when_definitions_change(scanner_with_email_pattern, tmp_path):
+    data = {
+        "sources": [
+            {
+                "name": "Phone Number",
+                "category": "Contact Information",
+                "patterns": [r"\+?\d{3}-\d{3}-\d{4}"],
+                "tags": {},
+            }
+        ]
+    }
+    (tmp_path / "email.json").write_text(json.dumps(data), encoding="utf-8")
+
+    reloaded = RegexScanner(data_elements_dir=tmp_path)
+
+    assert [e["name"] for e in reloaded.data_elements] == ["Phone Number"]
+
+
+def test_scanners_over_cached_elements_share_lookup_tables(scanner_with_email_pattern, tmp_path):
+    second = RegexScanner(data_elements_dir=tmp_path)
+
+    assert second._get_pattern_tables() is scanner_with_email_pattern._get_pattern_tables()
+
+    second.data_elements = [dict(second.data_elements[0])]
+    assert second._get_pattern_tables() is not scanner_with_email_pattern._get_pattern_tables()
+
+
+def test_elements_sharing_a_regex_share_one_compiled_pattern(tmp_path):
+    import re
+
+    shared = r"(?i)\bshared_regex_for_test\b"
+    for name in ("a", "b"):
+        data = {"sources": [{"name": name, "category": "Test", "patterns": [shared], "tags": {}}]}
+        (tmp_path / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+    scanner = RegexScanner(data_elements_dir=tmp_path, load_immediately=False)
+
+    scanner._parse_json_file(tmp_path / "a.json")
+    re.purge()
+    scanner._parse_json_file(tmp_path / "b.json")
+
+    first, second = (e["patterns"][0] for e in scanner.data_elements)
+    assert first is second
+
+
 # ---------------------------------------------------------------------------
 # scan_text — basic matching
 # ---------------------------------------------------------------------------
@@ -57,6 +115,21 @@ def test_scan_text_line_number_is_correct(scanner_with_email_pattern):
     assert findings[0]["line_number"] == 2
 
 
+def test_line_starts_offsets():
+    from src.regex_scanner import _line_starts
+
+    assert _line_starts("a\nbc\n\nd") == [0, 2, 5, 6]
+    assert _line_starts("x\n") == [0, 2]
+
+
+def test_scan_text_line_content_matches_line_number(scanner_with_email_pattern):
+    text = "x = 1\x0cy = 2\r\nuser_email = 'a@example.com'\r\n"
+    findings = scanner_with_email_pattern.scan_text(text)
+    assert len(findings) == 1
+    assert findings[0]["line_number"] == 2
+    assert findings[0]["line_content"] == "user_email = 'a@example.com'"
+
+
 def test_scan_text_one_finding_per_element_per_line(scanner_with_email_pattern):
     """Two emails on the same line should produce only one finding for that element."""
     line = "a = 'foo@x.com'; b = 'bar@y.com'"
@@ -64,6 +137,136 @@ def test_scan_text_one_finding_per_element_per_line(scanner_with_email_pattern):
     assert len(findings) == 1
 
 
+def test_scan_text_pattern_shared_by_elements_reports_each_element(tmp_path):
+    shared = r"(?i)\bpassport_no\b"
+    data = {
+        "sources": [
+            {"name": "Passport Number", "category": "Government-Issued Identifiers",
+             "patterns": [shared], "tags": {}},
+            {"name": "Travel Document", "category": "Government-Issued Identifiers",
+             "patterns": [r"(?i)\bvisa_no\b", shared], "tags": {}},
+        ]
+    }
+    (tmp_path / "ids.json").write_text(json.dumps(data), encoding="utf-8")
+    scanner = RegexScanner(data_elements_dir=tmp_path)
+
+    findings = scanner.scan_text("save(passport_no)\nsave(visa_no, passport_no)\n")
+
+    assert [(f["element_name"], f["line_number"]) for f in findings] == [
+        ("Passport Number", 1),
+        ("Passport Number", 2),
+        ("Travel Document", 2),
+        ("Travel Document", 1),
+    ]
+
+
+def test_false_positive_checks_apply_per_match_on_shared_line(tmp_path):
+    data = {
+        "sources": [
+            {"name": "Email Address", "category": "Contact Information",
+             "patterns": [r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"], "tags": {}},
+            {"name": "Date of Birth", "category": "Personal Identifiable Information",
+             "patterns": [r"(?i)\bdob\b"], "tags": {}},
+        ]
+    }
+    (tmp_path / "elements.json").write_text(json.dumps(data), encoding="utf-8")
+    scanner = RegexScanner(data_elements_dir=tmp_path)
+
+    findings = scanner.scan_text("contact = 'a@example.com'  # dob\n# b@example.com\n")
+
+    assert [(f["element_name"], f["line_number"]) for f in findings] == [("Email Address", 1)]
+
+
+def test_keyword_index_finds_present_keywords(monkeypatch):
+    import src.regex_scanner as regex_scanner
+
+    monkeypatch.setattr(regex_scanner, "_HAS_AHOCORASICK", False)
+    index = _KeywordIndex({"email", "phone", "@"})
+    assert index.hits("send_email(user@example.com)") == {"email", "@"}
+    assert index.hits("x = 1") == set()
+
+
+def test_keyword_index_automaton_matches_fallback(monkeypatch):
+    pytest.importorskip("ahocorasick")
+    import src.regex_scanner as regex_scanner
+
+    keywords = {"email", "mail", "phone", "@", "address"}
+    text = "send_email(user@example.com, address=home_address)"
+    with_automaton = _KeywordIndex(keywords).hits(text)
+    monkeypatch.setattr(regex_scanner, "_HAS_AHOCORASICK", False)
+    assert with_automaton == _KeywordIndex(keywords).hits(text) == {"email", "mail", "@", "address"}
+
+
+def test_scan_text_without_any_keyword_returns_empty(scanner_with_email_pattern):
+    assert scanner_with_email_pattern._get_pattern_tables().all_gated
+    assert scanner_with_email_pattern.scan_text("x = compute(1, 2)\n") == []
+
+
+def test_replacing_an_element_in_place_rebuilds_lookup_tables(tmp_path):
+    import re
+
+    def element(name, pattern, keyword):
+        return {"name": name, "category": "Test", "patterns": [re.compile(pattern)],
+                "keywords": [keyword], "tags": {}}
+
+    scanner = RegexScanner(data_elements_dir=tmp_path, load_immediately=False)
+    scanner.data_elements = [element("A", r"\bfoo\b", "foo")]
+    assert [f["element_name"] for f in scanner.scan_text("x = foo\n")] == ["A"]
+
+    scanner.data_elements[0] = element("B", r"\bbar\b", "bar")
+    assert [f["element_name"] for f in scanner.scan_text("x = bar\n")] == ["B"]
+
+
+
+def test_keyword_gate_runs_only_hit_elements_and_ungated_ones(tmp_path):
+    data = {
+        "sources": [
+            {"name": "SSN", "category": "Government-Issued Identifiers",
+             "patterns": [r"\b\d{3}-\d{2}-\d{4}\b"], "tags": {}},
+            {"name": "Date of Birth", "category": "Personal Identifiable Information",
+             "patterns": [r"(?i)\bdob\b"], "tags": {}},
+            {"name": "Passport Number", "category": "Government-Issued Identifiers",
+             "patterns": [r"(?i)\bpassport_no\b"], "tags": {}},
+        ]
+    }
+    (tmp_path / "elements.json").write_text(json.dumps(data), encoding="utf-8")
+    scanner = RegexScanner(data_elements_dir=tmp_path)
+
+    tables = scanner._get_pattern_tables()
+    assert tables.ungated == (0,)
+    assert not tables.all_gated
+
+    findings = scanner.scan_text("record(passport_no, ssn='123-45-6789')\nprint(dob)\n")
+    assert [(f["element_name"], f["line_number"]) for f in findings] == [
+        ("SSN", 1),
+        ("Date of Birth", 2),
+        ("Passport Number", 1),
+    ]
+
+
+def test_ascii_variant_only_used_where_matches_agree(tmp_path):
+    import re
+
+    from src.regex_scanner import _ascii_variant
+
+    assert _ascii_variant(re.compile(r"(?i)\bdob\b")).flags & re.ASCII
+    unicode_only = re.compile(r"(?u)\bdob\b")
+    assert _ascii_variant(unicode_only) is unicode_only
+
+    data = {
+        "sources": [
+            {"name": "Date of Birth", "category": "Personal Identifiable Information",
+             "patterns": [r"(?i)\bdate\s+of\s+birth\b"], "tags": {}},
+        ]
+    }
+    (tmp_path / "elements.json").write_text(json.dumps(data), encoding="utf-8")
+    scanner = RegexScanner(data_elements_dir=tmp_path)
+
+    # \x1c is whitespace to Unicode \s only, so that text keeps the Unicode patterns.
+    text = "a = 'Date of\x1cBirth'\nb = 'DATE OF BIRTH'\n"
+    assert [f["line_number"] for f in scanner.scan_text(text)] == [1, 2]
+    assert [f["line_number"] for f in scanner.scan_text("x = 'date of birth'\n")] == [1]
+
 # ---------------------------------------------------------------------------
 # False positive detection
 # ---------------------------------------------------------------------------
@@ -104,6 +307,159 @@ def test_return_statement_variable_is_false_positive(scanner_with_email_pattern)
         assert findings == []
 
 
+@pytest.mark.parametrize("line, skipped", [
+    ("function save(name, ssn) {", True),
+    ("{ssn: }", True),
+    ("return ssn;", True),
+    ("let ssn;", True),
+    ("ssn = ';", True),
+    ("ssnumber = '';", False),
+    ("ssn = load();", False),
+])
+def test_matched_text_false_positive_checks(line, skipped):
+    scanner = RegexScanner.__new__(RegexScanner)
+    start = line.index("ssn")
+    assert scanner._is_false_positive_match(line, "ssn", start, 0) is skipped
+
+
+@pytest.mark.parametrize("line, skipped", [
+    ('<meta name="viewport" content="width=device-width">', True),
+    ('<link rel="apple-touch-icon" href="icon.png">', True),
+    ("body { font-family: 'Google Fonts', sans-serif; }", True),
+    ("device = request.device_id", False),
+])
+def test_markup_lines_are_false_positives(line, skipped):
+    assert RegexScanner._is_false_positive_line(line) is skipped
+
+
+@pytest.mark.parametrize("line, matched, skipped", [
+    ("google_font = load()", "google", True),
+    ("screen.width = device", "device", True),
+    ("owner = device", "device", False),
+])
+def test_device_words_in_layout_context_are_false_positives(line, matched, skipped):
+    scanner = RegexScanner.__new__(RegexScanner)
+    assert scanner._is_false_positive_match(line, matched, line.index(matched), 0) is skipped
+
+
+# ---------------------------------------------------------------------------
+# RE2 prefilter
+# ---------------------------------------------------------------------------
+
+def _write_prefilter_elements(directory):
+    data = {
+        "sources": [
+            {
+                "name": "Email Address",
+                "category": "Contact Information",
+                "patterns": [r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"],
+                "tags": {},
+            },
+            {
+                "name": "Phone Number",
+                "category": "Contact Information",
+                "patterns": [r"(?i)(?<!Smartphone)\b(phone|mobile)\b"],
+                "tags": {},
+            },
+            {
+                "name": "Date of Birth",
+                "category": "Personal Identifiable Information",
+                "patterns": [r"(?i)\b(dob|date_of_birth)\b"],
+                "tags": {},
+            },
+        ]
+    }
+    (directory / "elements.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_re2_prefilter_keeps_stdlib_findings(tmp_path, monkeypatch):
+    pytest.importorskip("re2")
+    _write_prefilter_elements(tmp_path)
+    code = (
+        "user_email = 'a@example.com'\n"
+        "mobile = get_mobile()\n"
+        "widget = Smartphone(phone)\n"
+        "x = 1\n"
+        "note = 'caf\u00e9 dob'\n"
+    )
+
+    monkeypatch.delenv("TRUSCANNER_REGEX_ENGINE", raising=False)
+    with_re2 = RegexScanner(data_elements_dir=tmp_path)
+    assert with_re2._get_prefilter() is not None
+
+    monkeypatch.setenv("TRUSCANNER_REGEX_ENGINE", "re")
+    stdlib_only = RegexScanner(data_elements_dir=tmp_path)
+
+    findings = with_re2.scan_text(code)
+    assert {f["element_name"] for f in findings} == {"Email Address", "Date of Birth"}
+    assert findings == stdlib_only.scan_text(code)
+    assert with_re2.scan_text(code.encode("ascii", "ignore").decode()) == \
+        stdlib_only.scan_text(code.encode("ascii", "ignore").decode())
+
+
+def test_strip_lookarounds_widens_pattern():
+    from src.regex_scanner import _strip_lookarounds
+
+    assert _strip_lookarounds(r"(?i)(?<!Smartphone)\b(phone|mobile)\b") == r"(?i)\b(phone|mobile)\b"
+    assert _strip_lookarounds(r"address\b(?![^\s/(;)]*?\.(?:com|net))") == r"address\b"
+    assert _strip_lookarounds(r"[(?=]x\(?!y") == r"[(?=]x\(?!y"
+    assert _strip_lookarounds(r"a(?=b") is None
+
+
+def test_widen_for_placeholder_accepts_placeholder_where_re_takes_unicode():
+    from src.regex_scanner import _widen_for_placeholder
+
+    assert _widen_for_placeholder(r"(?i)\bab\b", True) == r"(?i)[a\x01][b\x01]"
+    assert _widen_for_placeholder(r"\w+@[a-z.]+\.\d", False) == r"[\w\x01]+@[a-z.]+\.[\d\x01]"
+    assert _widen_for_placeholder(r"[^\s/]{0,5}", False) == r"[^\s/]{0,5}"
+    assert _widen_for_placeholder(r"[^\W]", False) is None
+    assert _widen_for_placeholder(r"a\1", False) is None
+
+
+def test_re2_prefilter_screens_lookaround_patterns(tmp_path, monkeypatch):
+    pytest.importorskip("re2")
+    _write_prefilter_elements(tmp_path)
+    monkeypatch.delenv("TRUSCANNER_REGEX_ENGINE", raising=False)
+
+    scanner = RegexScanner(data_elements_dir=tmp_path)
+    prefilter = scanner._get_prefilter()
+    phone = next(e for e in scanner.data_elements if e["name"] == "Phone Number")["patterns"][0]
+
+    assert phone not in prefilter.candidates("dob = 1")
+    assert phone in prefilter.candidates("widget = Smartphone(phone)")
+    assert scanner.scan_text("widget = Smartphone(phone)") == []
+
+
+def test_re2_prefilter_screens_non_ascii_text(tmp_path, monkeypatch):
+    pytest.importorskip("re2")
+    _write_prefilter_elements(tmp_path)
+    monkeypatch.delenv("TRUSCANNER_REGEX_ENGINE", raising=False)
+
+    scanner = RegexScanner(data_elements_dir=tmp_path)
+    prefilter = scanner._get_prefilter()
+    patterns = {e["name"]: e["patterns"][0] for e in scanner.data_elements}
+
+    # re folds the dotless i onto "i", so the phone pattern matches here.
+    text = "caf\u00e9 = mob\u0131le\n"
+    assert patterns["Phone Number"].search(text)
+    candidates = prefilter.candidates(text)
+    assert candidates is not None
+    assert patterns["Phone Number"] in candidates
+    assert patterns["Date of Birth"] not in candidates
+    assert prefilter.candidates("\x01 caf\u00e9") is None
+
+
+def test_regex_engine_env_disables_re2(tmp_path, monkeypatch):
+    _write_prefilter_elements(tmp_path)
+    monkeypatch.setenv("TRUSCANNER_REGEX_ENGINE", "re")
+
+    scanner = RegexScanner(data_elements_dir=tmp_path)
+
+    assert scanner.use_re2 is False
+    assert scanner._get_prefilter() is None
+    assert scanner.scan_text("user_email = 'a@example.com'")
+
+
 # ---------------------------------------------------------------------------
 # scan_file
 # ---------------------------------------------------------------------------
@@ -144,6 +500,101 @@ def test_scan_directory_scans_multiple_files(scanner_with_email_pattern, tmp_pat
     assert str(tmp_path / "b.py") in filenames
 
 
+def test_scan_directory_records_file_stats(scanner_with_email_pattern, tmp_path):
+    (tmp_path / "a.py").write_text("email = 'a@example.com'\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("email = 'b@example.com'\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("x = 1\n", encoding="utf-8")
+
+    findings = scanner_with_email_pattern.scan_directory(str(tmp_path))
+
+    stats = scanner_with_email_pattern.last_scan_stats
+    assert stats["files_scanned"] == 3
+    assert stats["files_with_findings"] == len({f["filename"] for f in findings}) == 2
+
+
+@pytest.mark.parametrize("parent_threads", [1, 2], ids=["fork", "spawn"])
+def test_scan_directory_process_pool_matches_thread_scan(
+    scanner_with_email_pattern, tmp_path, monkeypatch, parent_threads
+):
+    monkeypatch.setattr(RegexScanner, "PROCESS_POOL_MIN_FILES", 16)
+    monkeypatch.setattr(RegexScanner, "PROCESS_POOL_FILES_PER_WORKER", 8)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for i in range(16):
+        body = f"email = 'user{i}@example.com'\n" if i % 3 == 0 else "x = 1\n"
+        (src_dir / f"m{i}.py").write_text(body, encoding="utf-8")
+
+    def key(finding):
+        return finding["filename"], finding["line_number"]
+
+    threaded = sorted(scanner_with_email_pattern.scan_directory(str(src_dir)), key=key)
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(threading, "active_count", lambda: parent_threads)
+    # Spawned workers are only used when asked for explicitly.
+    monkeypatch.setenv("TRUSCANNER_SCAN_PROCESSES", "2")
+    calls = []
+    pooled = scanner_with_email_pattern.scan_directory(
+        str(src_dir), progress_callback=lambda c, t, f: calls.append(c)
+    )
+
+    assert sorted(pooled, key=key) == threaded
+    assert scanner_with_email_pattern.last_scan_stats["files_with_findings"] == len(threaded)
+    assert calls[-1] == 16
+
+
+@pytest.mark.parametrize(
+    "total_files,parent_threads,env_processes,expected_workers",
+    [
+        (255, 1, None, None),  # below PROCESS_POOL_MIN_FILES
+        (256, 1, None, 4),  # one worker per 64 files
+        (1000, 1, None, 8),  # capped at the CPU count
+        (300, 2, None, None),  # workers would be spawned: stay on threads
+        (300, 2, "3", 3),  # ...unless processes are asked for explicitly
+    ],
+)
+def test_scan_directory_sizes_the_process_pool(
+    scanner_with_email_pattern, tmp_path, monkeypatch,
+    total_files, parent_threads, env_processes, expected_workers,
+):
+    for i in range(total_files):
+        (tmp_path / f"m{i}.py").write_text("", encoding="utf-8")
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(threading, "active_count", lambda: parent_threads)
+    if env_processes:
+        monkeypatch.setenv("TRUSCANNER_SCAN_PROCESSES", env_processes)
+    else:
+        monkeypatch.delenv("TRUSCANNER_SCAN_PROCESSES", raising=False)
+
+    pool_workers = []
+
+    def fake_pool(files, workers, progress_callback):
+        pool_workers.append(workers)
+        return []
+
+    monkeypatch.setattr(scanner_with_email_pattern, "_scan_files_in_processes", fake_pool)
+    scanner_with_email_pattern.scan_directory(str(tmp_path), processes=8)
+
+    assert pool_workers == ([expected_workers] if expected_workers else [])
+
+
+def test_scan_processes_env_overrides_argument(scanner_with_email_pattern, tmp_path, monkeypatch):
+    for i in range(RegexScanner.PROCESS_POOL_MIN_FILES):
+        (tmp_path / f"m{i}.py").write_text("x = 1\n", encoding="utf-8")
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    monkeypatch.setenv("TRUSCANNER_SCAN_PROCESSES", "1")
+
+    pool_calls = []
+    monkeypatch.setattr(
+        scanner_with_email_pattern, "_scan_files_in_processes", lambda *args: pool_calls.append(args)
+    )
+
+    assert scanner_with_email_pattern.scan_directory(str(tmp_path), processes=4) == []
+    assert pool_calls == []
+    assert scanner_with_email_pattern.last_scan_stats["files_scanned"] == RegexScanner.PROCESS_POOL_MIN_FILES
+
+
 def test_scan_directory_excludes_non_code_files(scanner_with_email_pattern, tmp_path):
     (tmp_path / "app.py").write_text("email = 'a@example.com'\n", encoding="utf-8")
     (tmp_path / "notes.txt").write_text("email = 'b@example.com'\n", encoding="utf-8")
@@ -166,6 +617,37 @@ def test_scan_directory_excludes_node_modules(scanner_with_email_pattern, tmp_pa
     assert not any("node_modules" in p for p in scanned)
 
 
+def test_scan_file_skips_binary_and_reads_text_like_open(scanner_with_email_pattern, tmp_path):
+    from src.regex_scanner import _read_source_file
+
+    binary = tmp_path / "blob.js"
+    binary.write_bytes(b"\x00\x01 email = 'a@example.com'")
+    assert scanner_with_email_pattern.scan_file(str(binary)) == []
+
+    text = tmp_path / "app.js"
+    text.write_bytes(b"x = 1\r\ny = 2\rz = '\xc3\xa9\xff'\nemail = 'a@example.com'\n")
+    with open(text, "r", encoding="utf-8", errors="ignore") as f:
+        assert _read_source_file(str(text)) == f.read()
+    assert [f["line_number"] for f in scanner_with_email_pattern.scan_file(str(text))] == [4]
+
+
+def test_scan_directory_skips_hidden_entries_and_symlinked_dirs(scanner_with_email_pattern, tmp_path):
+    src_dir = tmp_path / "src"
+    (src_dir / "pkg").mkdir(parents=True)
+    (src_dir / ".hidden").mkdir()
+    (src_dir / "pkg" / "a.py").write_text("email = 'a@example.com'\n", encoding="utf-8")
+    (src_dir / ".hidden" / "b.py").write_text("email = 'b@example.com'\n", encoding="utf-8")
+    (src_dir / ".c.py").write_text("email = 'c@example.com'\n", encoding="utf-8")
+    try:
+        (src_dir / "link").symlink_to(src_dir / "pkg", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+
+    findings = scanner_with_email_pattern.scan_directory(str(src_dir))
+
+    assert [f["filename"] for f in findings] == [str(src_dir / "pkg" / "a.py")]
+
+
 def test_scan_directory_path_not_found_returns_empty(scanner_with_email_pattern, tmp_path):
     findings = scanner_with_email_pattern.scan_directory(str(tmp_path / "nonexistent"))
     assert findings == []
@@ -217,6 +699,75 @@ def test_generate_report_contains_finding(scanner_with_email_pattern, tmp_path):
     assert "admin@example.com" in report
 
 
+def test_generate_reports_share_precomputed_summary(scanner_with_email_pattern, tmp_path):
+    findings = [
+        {
+            "filename": str(tmp_path / "app.py"),
+            "line_number": 3,
+            "element_name": "Email Address",
+            "element_category": "Contact Information",
+            "matched_text": "admin@example.com",
+            "line_content": "email = 'admin@example.com'",
+            "source": "Regex",
+            "tags": {},
+        }
+    ]
+    summary = scanner_with_email_pattern.summarize_findings(findings)
+    assert summary["distinct_detected_elements"] == 1
+    assert summary["categories"] == [("Contact Information", 1, [("Email Address", 1)])]
+
+    assert scanner_with_email_pattern.generate_report(findings, summary=summary) == (
+        scanner_with_email_pattern.generate_report(findings)
+    )
+    assert scanner_with_email_pattern.generate_markdown_report(findings, summary=summary) == (
+        scanner_with_email_pattern.generate_markdown_report(findings)
+    )
+
+
+def test_summary_orders_categories_and_elements_by_count(scanner_with_email_pattern):
+    pairs = [
+        ("Contact Information", "Phone Number"),
+        ("Financial Information", "Credit Card"),
+        ("Contact Information", "Email Address"),
+        ("Contact Information", "Email Address"),
+        ("Financial Information", "IBAN"),
+        ("Financial Information", "Credit Card"),
+    ]
+    findings = [{"element_category": c, "element_name": n} for c, n in pairs]
+
+    summary = scanner_with_email_pattern.summarize_findings(findings)
+
+    # Ties keep first-seen order.
+    assert summary["categories"] == [
+        ("Contact Information", 3, [("Email Address", 2), ("Phone Number", 1)]),
+        ("Financial Information", 3, [("Credit Card", 2), ("IBAN", 1)]),
+    ]
+
+
+@pytest.mark.parametrize("with_findings", [True, False])
+def test_generate_reports_stream_to_writer(scanner_with_email_pattern, tmp_path, with_findings):
+    findings = [
+        {
+            "filename": str(tmp_path / "app.py"),
+            "line_number": 3,
+            "element_name": "Email Address",
+            "element_category": "Contact Information",
+            "matched_text": "admin@example.com",
+            "line_content": "email = 'admin@example.com'",
+            "source": "Regex",
+            "tags": {"sensitivity": "high"},
+        }
+    ] if with_findings else []
+
+    for generate in (
+        scanner_with_email_pattern.generate_report,
+        scanner_with_email_pattern.generate_markdown_report,
+    ):
+        buffer = io.StringIO()
+        assert generate(findings, report_id="r-1", duration=1.5, writer=buffer) is None
+        assert buffer.getvalue() == generate(findings, report_id="r-1", duration=1.5)
+
+
 def test_generate_markdown_report_no_findings(scanner_with_email_pattern):
     report = scanner_with_email_pattern.generate_markdown_report([])
     assert "No data elements found" in report
@@ -230,6 +781,20 @@ def test_generate_json_report_structure(scanner_with_email_pattern):
     assert report["total_findings"] == 0
 
 
+def test_standalone_main_streams_report_to_file_and_console(tmp_path, monkeypatch, capsys):
+    from src import regex_scanner
+
+    (tmp_path / "app.py").write_text("email = 'a@example.com'\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["regex_scanner.py", str(tmp_path)])
+
+    regex_scanner.main()
+
+    saved = (tmp_path / "regex_scan_report.txt").read_text(encoding="utf-8")
+    assert "a@example.com" in saved
+    assert saved + "\n" in capsys.readouterr().out
+
+
 # ---------------------------------------------------------------------------
 # _normalize_extensions
 # ---------------------------------------------------------------------------
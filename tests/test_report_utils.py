@@ -1,4 +1,8 @@
-from src.report_utils import get_next_report_filename, sanitize_directory_name
+from src.report_utils import (
+    get_next_report_filename,
+    get_next_report_filenames,
+    sanitize_directory_name,
+)
 
 
 def test_sanitize_directory_name_replaces_invalid_characters():
@@ -13,3 +17,19 @@ def test_get_next_report_filename_increments_suffix(tmp_path):
     (tmp_path / "truscan_report3.txt").write_text("report", encoding="utf-8")
 
     assert get_next_report_filename(tmp_path, "txt") == "truscan_report4.txt"
+
+
+def test_get_next_report_filenames_resolves_each_type(tmp_path):
+    (tmp_path / "truscan_report.txt").write_text("report", encoding="utf-8")
+    (tmp_path / "truscan_report2.txt").write_text("report", encoding="utf-8")
+    (tmp_path / "truscan_report.json").write_text("{}", encoding="utf-8")
+
+    assert get_next_report_filenames(tmp_path, ["txt", "md", "json"]) == {
+        "txt": "truscan_report3.txt",
+        "md": "truscan_report.md",
+        "json": "truscan_report1.json",
+    }
+
+
+def test_get_next_report_filenames_missing_directory(tmp_path):
+    assert get_next_report_filenames(tmp_path / "missing", ["md"]) == {"md": "truscan_report.md"}
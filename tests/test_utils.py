@@ -1,9 +1,13 @@
 """Tests for src.utils — credentials, env loading, backend constant."""
 
+import json
+
 import pytest
 
+import src.utils as utils
 from src.utils import (
     BACKEND_URL,
+    encode_upload_payload,
     get_bedrock_region,
     get_missing_provider_requirements,
     get_openai_api_key,
@@ -158,3 +162,84 @@ def test_resolve_default_falls_back_to_ollama(monkeypatch):
                 "TRUSCANNER_PROFILE", "AWS_PROFILE"):
         monkeypatch.delenv(key, raising=False)
     assert resolve_default_ai_provider() == "ollama"
+
+
+# ---------------------------------------------------------------------------
+# upload_to_backend
+# ---------------------------------------------------------------------------
+
+class _FakeResponse:
+    status_code = 201
+    text = ""
+
+    def raise_for_status(self):
+        return None
+
+
+def _upload_fields():
+    return dict(
+        scan_report_id="abc123",
+        project_name="demo",
+        duration=1.5,
+        total_findings=1,
+        scan_data=[{"filename": "app.py", "element_name": "Email Address"}],
+        files_scanned=1,
+        metadata={"cli_version": "test"},
+    )
+
+
+def test_upload_to_backend_sends_encoded_payload(monkeypatch):
+    sent = {}
+
+    def fake_post(url, **kwargs):
+        sent.update(kwargs)
+        return _FakeResponse()
+
+    monkeypatch.setattr(utils.requests, "post", fake_post)
+    fields = _upload_fields()
+    body = encode_upload_payload(**fields)
+
+    assert utils.upload_to_backend(**fields, encoded_payload=body)
+    assert sent["data"] is body
+    assert sent["headers"]["Content-Type"] == "application/json"
+
+
+def test_upload_to_backend_encodes_payload_when_missing(monkeypatch):
+    sent = {}
+
+    def fake_post(url, **kwargs):
+        sent.update(kwargs)
+        return _FakeResponse()
+
+    monkeypatch.setattr(utils.requests, "post", fake_post)
+    fields = _upload_fields()
+
+    assert utils.upload_to_backend(**fields)
+    payload = json.loads(sent["data"].decode("utf-8"))
+    assert payload["scan_report_id"] == "abc123"
+    assert payload["duration_seconds"] == 1.5
+
+
+def test_upload_to_backend_reports_unencodable_payload(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(utils.requests, "post", lambda *a, **kw: pytest.fail("must not post"))
+    fields = _upload_fields()
+    fields["scan_data"] = [{"value": object()}]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(encode_upload_payload, **fields)
+        assert utils.upload_to_backend(**fields, encoded_payload=future) is False
+    assert utils.upload_to_backend(**fields) is False
+
+
+def test_filter_personal_findings_matches_category_substrings():
+    findings = [
+        {"element_category": "Personal Identifiable Information (PII)"},
+        {"element_category": "Contact Information"},
+        {"element_category": "Financial & Payment Data"},
+        {},
+    ]
+
+    assert utils.filter_personal_findings(findings) == findings[:2]
+
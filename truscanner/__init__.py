@@ -4,19 +4,32 @@ from typing import Any
 
 from src import __version__
 
-from .api import scan, scan_ai, scan_regex
+# The scan functions are imported from .api on first use, so `import
+# truscanner` does not load the scanners and their dependencies up front.
+_API_NAMES = ("scan", "scan_regex", "scan_ai")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _API_NAMES:
+        from . import api
+
+        value = getattr(api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class _CallableModule(types.ModuleType):
     """Allow `import truscanner; truscanner(path)` in Python code."""
 
     def __call__(self, path_or_url: str, **kwargs: Any):
-        return scan(path_or_url, **kwargs)
+        return truscanner(path_or_url, **kwargs)
 
 
 def truscanner(path_or_url: str, **kwargs: Any):
     """Function alias for users who prefer explicit function calls."""
-    return scan(path_or_url, **kwargs)
+    scan_func = globals().get("scan") or __getattr__("scan")
+    return scan_func(path_or_url, **kwargs)
 
 
 __all__ = ["scan", "scan_regex", "scan_ai", "truscanner", "__version__"]
@@ -1,5 +1,7 @@
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import unquote, urlparse
@@ -9,6 +11,8 @@ from src.regex_scanner import RegexScanner
 from src.report_utils import generate_report_id
 from src.scanner import run_ai_scan, run_regex_scan
 from src.utils import (
+    PERSONAL_CATEGORIES,
+    filter_personal_findings,
     get_bedrock_model_id,
     get_openai_api_key,
     has_bedrock_credentials,
@@ -22,23 +26,15 @@ load_runtime_env()
 PathLike = Union[str, os.PathLike]
 
 
-PERSONAL_CATEGORIES = [
-    "Personal Identifiable Information",
-    "PII",
-    "Contact Information",
-    "Government-Issued Identifiers",
-    "Authentication & Credentials",
-    "Health & Biometric Data",
-    "Sensitive Personal Data",
-]
-
-
 def _resolve_local_path(path_or_url: PathLike) -> Path:
     """Resolve a local filesystem path or file:// URL to an absolute Path."""
     raw = os.fspath(path_or_url)
-    parsed = urlparse(raw)
+    # A URL scheme needs a colon, so plain paths skip URL parsing.
+    parsed = urlparse(raw) if ":" in raw else None
 
-    if parsed.scheme in ("", "file"):
+    if parsed is None:
+        candidate = Path(raw)
+    elif parsed.scheme in ("", "file"):
         if parsed.scheme == "file":
             if parsed.netloc and parsed.netloc not in ("", "localhost"):
                 candidate = Path(f"//{parsed.netloc}{unquote(parsed.path)}")
@@ -52,18 +48,12 @@ def _resolve_local_path(path_or_url: PathLike) -> Path:
             f"Received scheme '{parsed.scheme}'."
         )
 
-    resolved = candidate.expanduser().resolve()
-    if not resolved.exists():
-        raise FileNotFoundError(f"Path not found: {resolved}")
-    return resolved
-
-
-def _filter_personal_findings(findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    return [
-        finding
-        for finding in findings
-        if any(cat in finding.get("element_category", "") for cat in PERSONAL_CATEGORIES)
-    ]
+    expanded = candidate.expanduser()
+    try:
+        # strict=True fails on a missing path itself, saving a separate stat.
+        return expanded.resolve(strict=True)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Path not found: {expanded.resolve()}") from None
 
 
 def _resolve_requested_ai_provider(
@@ -139,16 +129,16 @@ def scan_regex(
     configured_elements = len(getattr(scanner, "data_elements", []) or [])
     report_id = generate_report_id(target_str)
 
-    start_time = time.time()
+    start_time = time.monotonic()
     findings = run_regex_scan(
         target_str,
         extensions=extensions,
         regex_scanner=scanner,
     )
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
 
     if personal_only:
-        findings = _filter_personal_findings(findings)
+        findings = filter_personal_findings(findings)
 
     return {
         "scan_report_id": report_id,
@@ -170,6 +160,7 @@ def scan_ai(
     model: Optional[str] = None,
     extensions: Optional[List[str]] = None,
     personal_only: bool = False,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Dict[str, Any]:
     """Run only the AI/LLM scanner on a local path or ``file://`` URL.
 
@@ -185,6 +176,8 @@ def scan_ai(
             an Ollama model name or a Bedrock model ID).
         extensions: Restrict scanning to files with these extensions.
         personal_only: When ``True``, keep only PII-related findings.
+        cancel_event: Optional ``threading.Event``; once set, the scan stops
+            before sending its next file to the provider.
 
     Returns:
         A dict with the following keys:
@@ -207,7 +200,11 @@ def scan_ai(
     )
     selected_model = _resolve_ai_model(provider, model=model)
 
-    start_time = time.time()
+    scan_kwargs: Dict[str, Any] = {}
+    if cancel_event is not None:
+        scan_kwargs["cancel_event"] = cancel_event
+
+    start_time = time.monotonic()
     findings = run_ai_scan(
         target_str,
         ai_provider=provider,
@@ -215,11 +212,12 @@ def scan_ai(
         model=selected_model,
         extensions=extensions,
         use_openai=provider == "openai",
+        **scan_kwargs,
     )
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
 
     if personal_only:
-        findings = _filter_personal_findings(findings)
+        findings = filter_personal_findings(findings)
 
     return {
         "directory_scanned": target_str,
@@ -246,11 +244,12 @@ def scan(
     """Run a full scan (regex + optional AI) on a local path or ``file://`` URL.
 
     This is the primary programmatic entry point. It always runs the regex
-    scanner and optionally follows up with an AI scanner when ``with_ai=True``.
+    scanner and, when ``with_ai=True``, runs the AI scanner at the same time.
 
     Args:
         path_or_url: Filesystem path or ``file://`` URL to a file or directory.
-        with_ai: When ``True``, run the AI/LLM scanner after the regex scan.
+        with_ai: When ``True``, also run the AI/LLM scanner, concurrently with
+            the regex scan.
         personal_only: When ``True``, keep only PII-related findings from both
             scanners.
         use_openai: Deprecated shorthand for ``ai_provider="openai"``.
@@ -279,32 +278,56 @@ def scan(
         print(result["total_findings"])   # regex findings count
         print(result["ai_total_findings"])  # AI findings count
     """
-    regex_result = scan_regex(
-        path_or_url,
-        personal_only=personal_only,
-        extensions=extensions,
-    )
-
-    ai_result = {
-        "directory_scanned": regex_result["directory_scanned"],
-        "ai_provider": None,
-        "ai_model": None,
-        "ai_total_findings": 0,
-        "ai_scan_duration_seconds": None,
-        "token_usage": {},
-        "ai_findings": [],
-    }
-
     if with_ai:
-        ai_result = scan_ai(
+        # The AI scan does not depend on regex findings, so it runs in a
+        # thread while the regex scan uses this one; the call then takes as
+        # long as the slower of the two instead of their sum. Bad paths are
+        # rejected before either starts.
+        _resolve_local_path(path_or_url)
+        cancel_ai = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            ai_future = executor.submit(
+                scan_ai,
+                path_or_url,
+                ai_provider=ai_provider,
+                ai_mode=ai_mode,
+                use_openai=use_openai,
+                model=model,
+                extensions=extensions,
+                personal_only=personal_only,
+                cancel_event=cancel_ai,
+            )
+            regex_result = scan_regex(
+                path_or_url,
+                personal_only=personal_only,
+                extensions=extensions,
+            )
+            ai_result = ai_future.result()
+        except BaseException:
+            # The regex scan failed: stop the AI scan before its next
+            # provider call. A call already in flight still completes.
+            cancel_ai.set()
+            raise
+        finally:
+            # Don't block the caller on the AI thread; it exits on its own
+            # once it sees cancel_ai.
+            executor.shutdown(wait=False)
+    else:
+        regex_result = scan_regex(
             path_or_url,
-            ai_provider=ai_provider,
-            ai_mode=ai_mode,
-            use_openai=use_openai,
-            model=model,
-            extensions=extensions,
             personal_only=personal_only,
+            extensions=extensions,
         )
+        ai_result = {
+            "directory_scanned": regex_result["directory_scanned"],
+            "ai_provider": None,
+            "ai_model": None,
+            "ai_total_findings": 0,
+            "ai_scan_duration_seconds": None,
+            "token_usage": {},
+            "ai_findings": [],
+        }
 
     return {
         "scan_report_id": regex_result["scan_report_id"],